@@ -76,8 +76,8 @@ def validate(
     yaml_path: str = typer.Argument(help="Path to workflow YAML file"),
 ) -> None:
     """Validate a workflow YAML file without executing."""
-    import yaml as pyyaml
     from pyflow.models.workflow import WorkflowDef
+    from pyflow.models.yaml_loader import safe_load_yaml
 
     path = Path(yaml_path)
     if not path.exists():
@@ -85,7 +85,7 @@ def validate(
         raise typer.Exit(code=1)
 
     try:
-        data = pyyaml.safe_load(path.read_text())
+        data = safe_load_yaml(path.read_text())
         workflow = WorkflowDef(**data)
         typer.echo(f"Valid workflow: {workflow.name}")
     except Exception as e:
@@ -8,7 +8,7 @@ from pyflow.models.workflow import SkillDef
 class AgentCard(BaseModel):
     """A2A protocol agent card -- describes agent capabilities for discovery."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     name: str
     description: str = ""
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import yaml
 from pydantic import BaseModel, Field
 
 from pyflow.models.agent import OpenApiToolConfig
+from pyflow.models.yaml_loader import load_yaml_file
 
 
 class ProjectConfig(BaseModel):
@@ -26,5 +26,5 @@ class ProjectConfig(BaseModel):
         """
         if not path.exists():
             return cls()
-        data = yaml.safe_load(path.read_text())
+        data = load_yaml_file(path)
         return cls(**(data or {}))
@@ -3,15 +3,17 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Literal
 
-import yaml
-from pydantic import BaseModel, model_validator
+from pydantic import BaseModel, ConfigDict, model_validator
 
 from pyflow.models.agent import AgentConfig
+from pyflow.models.yaml_loader import load_yaml_file
 
 
 class SkillDef(BaseModel):
     """A skill exposed via the A2A protocol."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str
     name: str
     description: str = ""
@@ -204,5 +206,5 @@ class WorkflowDef(BaseModel):
         """Load and validate a YAML file into a WorkflowDef."""
         if not path.exists():
             raise FileNotFoundError(f"Workflow file not found: {path}")
-        data = yaml.safe_load(path.read_text())
+        data = load_yaml_file(path)
         return cls(**data)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import copy
+import functools
+import json
+import re
+import time
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+try:
+    # libyaml's C parser; same safe semantics as SafeLoader, many times faster.
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader
+
+
+# YAML 1.1 only reads a number as a float if it has a "." and, when there is an
+# exponent, a signed one; PyYAML keeps JSON literals like 1e-3 or 1.0e3 as strings.
+_YAML_FLOAT = re.compile(r"-?[0-9]+\.[0-9]*(?:[eE][-+][0-9]+)?")
+# \uD800-\uDFFF escapes decode in JSON but are rejected by YAML.
+_SURROGATE_ESCAPE = re.compile(r"\\u[dD][89a-fA-F]")
+# Characters JSON accepts raw but YAML rejects or reads as line breaks: tabs,
+# C0/C1 controls, DEL, NEL and the Unicode line/paragraph separators.
+_YAML_UNSAFE_CHAR = re.compile(
+    r"[^\n\r\x20-\x7e\xa0-\u2027\u202a-\ud7ff\ue000-\ufffd\U00010000-\U0010ffff]"
+)
+# Files modified this recently are parsed uncached: a same-size edit within one
+# mtime tick would otherwise leave the (mtime_ns, size) key unchanged.
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+def _yaml_float(literal: str) -> float | str:
+    return float(literal) if _YAML_FLOAT.fullmatch(literal) else literal
+
+
+def safe_load_yaml(text: str) -> Any:
+    """Parse a YAML document like ``yaml.safe_load``, using libyaml when available.
+
+    Documents written as a single JSON object or array are decoded with the
+    JSON parser first (tens of times faster), with YAML's reading of numbers:
+    ``1e-3`` and ``NaN`` stay strings, as YAML leaves them. Anything the JSON
+    parser rejects, or that holds a character YAML treats differently (tabs,
+    control characters, surrogate escapes), goes through YAML.
+    """
+    if (
+        text.lstrip()[:1] in ("{", "[")
+        and not _SURROGATE_ESCAPE.search(text)
+        and not _YAML_UNSAFE_CHAR.search(text)
+    ):
+        try:
+            return json.loads(text, parse_float=_yaml_float, parse_constant=str)
+        except ValueError:
+            pass
+    return yaml.load(text, Loader=_SafeLoader)
+
+
+def load_yaml_file(path: Path) -> Any:
+    """Read and parse a YAML file, reusing the parse while the file is unchanged.
+
+    The cache is keyed on the resolved path and its ``(mtime_ns, size)``; files
+    modified within the last ``_RACY_WINDOW_NS`` are always reparsed. Each
+    caller gets its own deep copy, so the cached document is never mutated.
+    Raises FileNotFoundError if the file does not exist.
+    """
+    path = path.resolve()
+    stat = path.stat()
+    if time.time_ns() - stat.st_mtime_ns < _RACY_WINDOW_NS:
+        return safe_load_yaml(path.read_text())
+    return copy.deepcopy(_load_yaml_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse the file at path. ``mtime_ns`` and ``size`` only key the cache."""
+    return safe_load_yaml(Path(path).read_text())
@@ -8,18 +8,19 @@ class AgentCardGenerator:
     """Generates A2A agent cards from workflow definitions."""
 
     def __init__(self, base_url: str = "http://localhost:8000"):
-        self._base_url = base_url.rstrip("/")
+        self._a2a_prefix = f"{base_url.rstrip('/')}/a2a/"
 
     def generate_card(self, workflow: WorkflowDef) -> AgentCard:
-        """Build an AgentCard from a WorkflowDef."""
-        skills: list[SkillDef] = []
-        if workflow.a2a and workflow.a2a.skills:
-            skills = list(workflow.a2a.skills)
+        """Build an AgentCard from a WorkflowDef.
+
+        Skills are frozen, so the card shares the workflow's SkillDef instances.
+        """
+        skills: list[SkillDef] = workflow.a2a.skills if workflow.a2a else []
 
         return AgentCard(
             name=workflow.name,
             description=workflow.description,
-            url=f"{self._base_url}/a2a/{workflow.name}",
+            url=self._a2a_prefix + workflow.name,
             version=workflow.a2a.version if workflow.a2a else "1.0.0",
             skills=skills,
         )
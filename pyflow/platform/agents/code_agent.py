@@ -3,12 +3,14 @@ from __future__ import annotations
 import importlib
 import inspect
 import json
-from typing import AsyncGenerator
+from collections.abc import Callable
+from typing import Any, AsyncGenerator
 
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events.event import Event, EventActions
 from google.genai import types
+from pydantic import PrivateAttr
 
 
 class CodeAgent(BaseAgent):
@@ -23,11 +25,25 @@ class CodeAgent(BaseAgent):
     input_keys: list[str]
     output_key: str
 
+    _func: Callable[..., Any] | None = PrivateAttr(default=None)
+    _is_coroutine: bool = PrivateAttr(default=False)
+
+    def _resolve_function(self) -> Callable[..., Any]:
+        """Import the target function on first use and reuse it afterwards.
+
+        Failed imports are not cached, so every run reports the error.
+        """
+        if self._func is None:
+            func = _import_function(self.function_path)
+            self._is_coroutine = inspect.iscoroutinefunction(func)
+            self._func = func
+        return self._func
+
     async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
         try:
-            func = _import_function(self.function_path)
+            func = self._resolve_function()
             kwargs = {key: ctx.session.state.get(key) for key in self.input_keys}
-            if inspect.iscoroutinefunction(func):
+            if self._is_coroutine:
                 result = await func(**kwargs)
             else:
                 result = func(**kwargs)
@@ -1,21 +1,31 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass
 from typing import AsyncGenerator
 
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events.event import Event
+from pydantic import PrivateAttr
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DagNodeRuntime:
     """Runtime DAG node pairing an agent with its dependency names."""
 
     name: str
     agent: BaseAgent
-    depends_on: set[str] = field(default_factory=set)
+    depends_on: frozenset[str] = frozenset()
+
+    def __post_init__(self) -> None:
+        # Accept any iterable of names; intern them so the scheduler's dict and
+        # set lookups compare by identity across nodes sharing a dependency.
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(
+            self, "depends_on", frozenset(sys.intern(dep) for dep in self.depends_on)
+        )
 
 
 class DagAgent(BaseAgent):
@@ -32,41 +42,58 @@ class DagAgent(BaseAgent):
 
     model_config = {"arbitrary_types_allowed": True}
 
+    _waves: list[list[DagNodeRuntime]] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, context, /) -> None:
+        """Group nodes into execution waves once, at construction time."""
+        super().model_post_init(context)
+        self._waves = _topological_waves(self.dag_nodes)
+
     async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
         """Execute DAG with wave-based parallel scheduling."""
-        nodes_by_name = {n.name: n for n in self.dag_nodes}
-        remaining_deps = {n.name: set(n.depends_on) for n in self.dag_nodes}
-        completed: set[str] = set()
-        started: set[str] = set()
-
-        while len(completed) < len(self.dag_nodes):
-            # Find ready nodes: all deps satisfied, not started
-            ready = [
-                name
-                for name, deps in remaining_deps.items()
-                if deps.issubset(completed) and name not in started
-            ]
-
-            if not ready:
-                raise RuntimeError("DAG deadlock: no ready nodes but not all completed")
-
-            # Launch ready nodes in parallel
-            async def run_node(node_name: str):
-                node = nodes_by_name[node_name]
-                events = []
-                async for event in node.agent.run_async(ctx):
-                    events.append(event)
-                return node_name, events
-
-            tasks = [run_node(name) for name in ready]
-            for name in ready:
-                started.add(name)
-
-            # Run in parallel with gather
-            finished = await asyncio.gather(*tasks)
-
-            for node_name, events in finished:
-                completed.add(node_name)
-                # Yield all events from this node
+
+        async def run_node(node: DagNodeRuntime) -> list[Event]:
+            return [event async for event in node.agent.run_async(ctx)]
+
+        for wave in self._waves:
+            # Nodes in a wave only depend on earlier waves, so run them in parallel
+            finished = await asyncio.gather(*(run_node(node) for node in wave))
+            for events in finished:
                 for event in events:
                     yield event
+
+
+def _topological_waves(nodes: list[DagNodeRuntime]) -> list[list[DagNodeRuntime]]:
+    """Layer nodes with Kahn's algorithm: each wave depends only on earlier waves.
+
+    Raises ValueError if some nodes can never run (cycle or unknown dependency).
+    """
+    remaining = {node.name: set(node.depends_on) for node in nodes}
+    dependents: dict[str, list[str]] = {node.name: [] for node in nodes}
+    for node in nodes:
+        for dep in node.depends_on:
+            if dep in dependents:
+                dependents[dep].append(node.name)
+
+    nodes_by_name = {node.name: node for node in nodes}
+    position = {node.name: i for i, node in enumerate(nodes)}
+    ready = [node.name for node in nodes if not node.depends_on]
+    waves: list[list[DagNodeRuntime]] = []
+    while ready:
+        waves.append([nodes_by_name[name] for name in ready])
+        next_ready = []
+        for name in ready:
+            for child in dependents[name]:
+                remaining[child].discard(name)
+                if not remaining[child]:
+                    next_ready.append(child)
+        # Keep declaration order within a wave so event order is deterministic
+        ready = sorted(next_ready, key=position.__getitem__)
+
+    scheduled = sum(len(wave) for wave in waves)
+    if scheduled < len(nodes):
+        blocked = sorted(name for name, deps in remaining.items() if deps)
+        raise ValueError(
+            f"DAG deadlock: nodes {blocked} can never run (cycle or unknown dependency)"
+        )
+    return waves
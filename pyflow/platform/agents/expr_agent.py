@@ -1,14 +1,43 @@
 from __future__ import annotations
 
+import ast
 import json
+from types import CodeType
 from typing import AsyncGenerator
 
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events.event import Event, EventActions
 from google.genai import types
+from pydantic import PrivateAttr
+
+from pyflow.tools.condition import _SAFE_BUILTINS, _parse_expression
+
+# Literal types safe to share between runs (an emitted state_delta may be mutated).
+_IMMUTABLE_RESULT_TYPES = (bool, int, float, complex, str, bytes, type(None))
+_NOT_FOLDED = object()
+# Nodes a folded expression may contain: literals combined by operators.
+# Anything else (containers, comprehensions, calls, names) is evaluated per run.
+_FOLDABLE_NODES = (
+    ast.Expression,
+    ast.Constant,
+    ast.UnaryOp,
+    ast.BoolOp,
+    ast.Compare,
+    ast.BinOp,
+    ast.unaryop,
+    ast.boolop,
+    ast.cmpop,
+    ast.operator,
+)
+# Operators whose cost grows with operand values (``9 ** 9 ** 9``, ``'a' * 10 ** 12``);
+# folded only when both operands are small literals.
+_COSTLY_OPS = (ast.Pow, ast.Mult, ast.LShift)
+_FOLD_OPERAND_LIMIT = 1024
+# What operators on literals can raise: bad arithmetic or operand types,
+# out-of-range values, or a result too large to allocate.
+_FOLD_ERRORS = (ArithmeticError, MemoryError, TypeError, ValueError)
 
-from pyflow.tools.condition import _SAFE_BUILTINS, _validate_ast
 
 class ExprAgent(BaseAgent):
     """Non-LLM agent that evaluates a safe Python expression.
@@ -25,27 +54,42 @@ class ExprAgent(BaseAgent):
     input_keys: list[str]
     output_key: str
 
-    def model_post_init(self, __context) -> None:
-        """Validate the expression AST at construction time for fast failure."""
-        super().model_post_init(__context)
-        _validate_ast(self.expression)
+    _code: CodeType = PrivateAttr()
+    _const_result: object = PrivateAttr(default=None)
+    _is_const: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, context, /) -> None:
+        """Validate and compile the expression once, at construction time.
+
+        Invalid expressions fail fast here, and each run only executes the
+        code object, which is shared by every agent with the same expression.
+        """
+        super().model_post_init(context)
+        tree, self._code = _parse_expression(self.expression)
+        if _is_foldable(tree):
+            folded = _fold_constant(self._code)
+            if folded is not _NOT_FOLDED:
+                self._const_result, self._is_const = folded, True
 
     async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
-        try:
-            variables = {key: ctx.session.state.get(key) for key in self.input_keys}
-            env = {"__builtins__": _SAFE_BUILTINS, **variables}
-            result = eval(self.expression, env)  # noqa: S307 — AST-validated sandbox
-        except Exception as exc:
-            yield Event(
-                author=self.name,
-                invocation_id=ctx.invocation_id,
-                content=types.Content(
-                    parts=[types.Part(text=f"ExprAgent error: {exc}")],
-                    role="model",
-                ),
-                actions=EventActions(state_delta={}),
-            )
-            return
+        if self._is_const:
+            result = self._const_result
+        else:
+            try:
+                variables = {key: ctx.session.state.get(key) for key in self.input_keys}
+                env = {"__builtins__": _SAFE_BUILTINS, **variables}
+                result = eval(self._code, env)  # AST-validated sandbox
+            except Exception as exc:
+                yield Event(
+                    author=self.name,
+                    invocation_id=ctx.invocation_id,
+                    content=types.Content(
+                        parts=[types.Part(text=f"ExprAgent error: {exc}")],
+                        role="model",
+                    ),
+                    actions=EventActions(state_delta={}),
+                )
+                return
 
         result_text = json.dumps(result) if not isinstance(result, str) else result
         yield Event(
@@ -57,3 +101,53 @@ class ExprAgent(BaseAgent):
             ),
             actions=EventActions(state_delta={self.output_key: result}),
         )
+
+
+def _fold_constant(code: CodeType) -> object:
+    """Evaluate an expression accepted by ``_is_foldable`` once, or return ``_NOT_FOLDED``.
+
+    Expressions that raise one of ``_FOLD_ERRORS`` (e.g. ``1 / 0``) are left
+    to fail at run time with the usual error event.
+    """
+    try:
+        return eval(code, {"__builtins__": _SAFE_BUILTINS})  # AST-validated sandbox
+    except _FOLD_ERRORS:
+        return _NOT_FOLDED
+
+
+def _is_foldable(tree: ast.Expression) -> bool:
+    """True if the tree only combines immutable literals with cheap operators.
+
+    Only ``_FOLDABLE_NODES`` are allowed, string formatting with ``%`` is
+    never folded, and ``_COSTLY_OPS`` need small literal operands, so folding
+    stays bounded and its result is always immutable.
+    """
+    for node in ast.walk(tree):
+        if not isinstance(node, _FOLDABLE_NODES):
+            return False
+        if isinstance(node, ast.Constant) and type(node.value) not in _IMMUTABLE_RESULT_TYPES:
+            return False
+        if isinstance(node, ast.BinOp):
+            if isinstance(node.op, ast.Mod) and not _is_number_literal(node.left):
+                return False
+            if isinstance(node.op, _COSTLY_OPS) and not (
+                _is_small_literal(node.left) and _is_small_literal(node.right)
+            ):
+                return False
+    return True
+
+
+def _is_number_literal(node: ast.expr) -> bool:
+    return isinstance(node, ast.Constant) and isinstance(node.value, (int, float, complex))
+
+
+def _is_small_literal(node: ast.expr) -> bool:
+    """True for a numeric, string or bytes literal bounded by ``_FOLD_OPERAND_LIMIT``."""
+    if not isinstance(node, ast.Constant):
+        return False
+    value = node.value
+    if isinstance(value, (int, float)):
+        return abs(value) <= _FOLD_OPERAND_LIMIT
+    if isinstance(value, (str, bytes)):
+        return len(value) <= _FOLD_OPERAND_LIMIT
+    return False
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import re
-from copy import deepcopy
+from collections.abc import Callable, Mapping
 from typing import Any, AsyncGenerator
 
 from google.adk.agents.base_agent import BaseAgent
@@ -10,13 +10,16 @@ from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events.event import Event, EventActions
 from google.adk.tools.tool_context import ToolContext
 from google.genai import types
-from pydantic import ConfigDict
+from pydantic import ConfigDict, PrivateAttr
 
 from pyflow.tools.base import BasePlatformTool
 
 # Pattern matching ``{variable_name}`` placeholders in config values.
 _TEMPLATE_RE = re.compile(r"\{(\w+)\}")
 
+# A compiled template: maps session state to the resolved value.
+_Resolver = Callable[[Mapping[str, Any]], Any]
+
 
 class ToolAgent(BaseAgent):
     """Non-LLM agent that executes a platform tool with fixed configuration.
@@ -33,9 +36,21 @@ class ToolAgent(BaseAgent):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    _resolve_config: _Resolver = PrivateAttr()
+
+    def model_post_init(self, context, /) -> None:
+        """Compile *fixed_config* templates once so runs skip re-scanning it."""
+        super().model_post_init(context)
+        self._resolve_config = _compile_templates(self.fixed_config)
+
     async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
         try:
-            resolved = _resolve_templates(self.fixed_config, dict(ctx.session.state))
+            state = ctx.session.state
+            if state:
+                resolved = self._resolve_config(state)
+            else:
+                # Every placeholder is kept, so the result is a copy of the config
+                resolved = _copy_containers(self.fixed_config)
             tc = ToolContext(ctx)
             result = await self.tool_instance.execute(tool_context=tc, **resolved)
         except Exception as exc:
@@ -62,27 +77,59 @@ class ToolAgent(BaseAgent):
         )
 
 
-def _resolve_templates(config: dict[str, Any], state: dict[str, Any]) -> dict[str, Any]:
+def _resolve_templates(config: dict[str, Any], state: Mapping[str, Any]) -> dict[str, Any]:
     """Recursively resolve ``{variable}`` templates in config values from state."""
-    resolved = deepcopy(config)
-    for key, value in resolved.items():
-        resolved[key] = _resolve_value(value, state)
-    return resolved
+    if not state:
+        return _copy_containers(config)
+    return _compile_templates(config)(state)
 
 
-def _resolve_value(value: Any, state: dict[str, Any]) -> Any:
-    """Resolve a single value, recursing into dicts and lists."""
-    if isinstance(value, str):
-        return _resolve_string(value, state)
+def _compile_templates(value: Any) -> _Resolver:
+    """Compile a config value into a resolver, scanning its strings only once.
+
+    Every dict and list resolves to a fresh container, so a tool that mutates
+    its arguments cannot change the config seen by later runs. Subtrees
+    without templates are only copied, not rescanned; scalars and values
+    substituted from state are passed by reference.
+    """
+    resolve = _compile_dynamic(value)
+    if resolve is not None:
+        return resolve
+    if isinstance(value, (dict, list)):
+        return lambda state: _copy_containers(value)
+    return lambda state: value
+
+
+def _copy_containers(value: Any) -> Any:
+    """Copy nested dicts and lists; other values are shared, not deep-copied."""
     if isinstance(value, dict):
-        return {k: _resolve_value(v, state) for k, v in value.items()}
+        return {key: _copy_containers(item) for key, item in value.items()}
     if isinstance(value, list):
-        return [_resolve_value(item, state) for item in value]
+        return [_copy_containers(item) for item in value]
     return value
 
 
-def _resolve_string(value: str, state: dict[str, Any]) -> Any:
-    """Resolve a string template.
+def _compile_dynamic(value: Any) -> _Resolver | None:
+    """Like ``_compile_templates``, but return None if *value* has no templates."""
+    if isinstance(value, str):
+        return _compile_string(value)
+    if isinstance(value, dict):
+        items = [(key, _compile_dynamic(item)) for key, item in value.items()]
+        if all(resolve is None for _, resolve in items):
+            return None
+        items = [(key, resolve or _compile_templates(value[key])) for key, resolve in items]
+        return lambda state: {key: resolve(state) for key, resolve in items}
+    if isinstance(value, list):
+        resolvers = [_compile_dynamic(item) for item in value]
+        if all(resolve is None for resolve in resolvers):
+            return None
+        resolvers = [resolve or _compile_templates(item) for item, resolve in zip(value, resolvers)]
+        return lambda state: [resolve(state) for resolve in resolvers]
+    return None
+
+
+def _compile_string(value: str) -> _Resolver | None:
+    """Compile a string template, or return None if it has no placeholders.
 
     Full match ``"{key}"`` → raw state value (preserves type).
     Partial match ``"prefix_{key}_suffix"`` → string interpolation.
@@ -91,9 +138,47 @@ def _resolve_string(value: str, state: dict[str, Any]) -> Any:
     if match:
         # Full match — return raw value to preserve type
         key = match.group(1)
-        return state.get(key, value)
-    # Partial match — string interpolation
-    def _replacer(m: re.Match) -> str:
-        return str(state.get(m.group(1), m.group(0)))
+        return lambda state: state.get(key, value)
+
+    # Alternating literal text and keys: [text, key, text, key, ..., text]
+    parts = _TEMPLATE_RE.split(value)
+    if len(parts) == 1:
+        return None
+    literals = parts[0::2]
+    keys = parts[1::2]
+
+    # Partial match — string interpolation. str.format_map does the splicing
+    # in C; literal braces are escaped, and all-digit keys (which format
+    # would treat as positional fields) take the pure-Python path.
+    if not any(key.isdigit() for key in keys):
+        escaped = [literal.replace("{", "{{").replace("}", "}}") for literal in literals]
+        fmt = "".join(text + f"{{{key}}}" for text, key in zip(escaped, keys)) + escaped[-1]
+
+        def _format(state: Mapping[str, Any]) -> str:
+            try:
+                return fmt.format_map(state)
+            except KeyError:
+                return fmt.format_map(_KeepMissing(state))
+
+        return _format
+
+    def _interpolate(state: Mapping[str, Any]) -> str:
+        out = [literals[0]]
+        for key, literal in zip(keys, literals[1:]):
+            out.append(str(state[key]) if key in state else f"{{{key}}}")
+            out.append(literal)
+        return "".join(out)
+
+    return _interpolate
+
+
+class _KeepMissing:
+    """``format_map`` view of state that renders missing keys as ``{key}``."""
+
+    __slots__ = ("_state",)
+
+    def __init__(self, state: Mapping[str, Any]) -> None:
+        self._state = state
 
-    return _TEMPLATE_RE.sub(_replacer, value)
+    def __getitem__(self, key: str) -> Any:
+        return self._state.get(key, f"{{{key}}}")
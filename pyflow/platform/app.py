@@ -18,6 +18,7 @@ from pyflow.platform.executor import WorkflowExecutor
 from pyflow.platform.registry.tool_registry import ToolRegistry
 from pyflow.platform.registry.workflow_registry import WorkflowRegistry
 from pyflow.tools.base import set_secrets
+from pyflow.tools.client import aclose_clients
 
 logger = structlog.get_logger()
 
@@ -146,6 +147,7 @@ class PyFlowPlatform:
 
     async def shutdown(self) -> None:
         """Cleanup platform resources."""
+        await aclose_clients()
         self._booted = False
         logger.info("platform.shutdown")
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import functools
 from pathlib import Path
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, ClassVar, Union
 
 from google.adk.agents.llm_agent import LlmAgent
 from google.adk.agents.loop_agent import LoopAgent
@@ -13,6 +13,7 @@ from google.adk.tools.agent_tool import AgentTool
 from google.genai import types
 
 from pyflow.models.agent import AgentConfig
+from pyflow.models.project import ProjectConfig
 from pyflow.models.workflow import WorkflowDef
 from pyflow.platform.agents.code_agent import CodeAgent
 from pyflow.platform.agents.dag_agent import DagAgent, DagNodeRuntime
@@ -20,12 +21,15 @@ from pyflow.platform.agents.expr_agent import ExprAgent
 from pyflow.platform.agents.tool_agent import ToolAgent
 from pyflow.platform.callbacks import resolve_callback
 from pyflow.platform.hydration.schema import json_schema_to_pydantic
+from pyflow.platform.registry.tool_registry import ToolRegistry
 
 if TYPE_CHECKING:
     from google.adk.agents.base_agent import BaseAgent
     from google.adk.models.base_llm import BaseLlm
 
-    from pyflow.platform.registry.tool_registry import ToolRegistry
+
+# Model string prefixes routed through LiteLlm instead of the native Gemini client
+_LITELLM_PREFIXES = ("anthropic/", "openai/")
 
 
 @functools.lru_cache(maxsize=1)
@@ -36,6 +40,20 @@ def _get_litellm():
     return LiteLlm
 
 
+@functools.lru_cache(maxsize=64)
+def _make_litellm_model(model: str) -> BaseLlm:
+    """Build the LiteLlm wrapper for ``model`` once; agents share the instance."""
+    return _get_litellm()(model=model)
+
+
+# ADK workflow agent class for each nested workflow AgentConfig.type
+_WORKFLOW_AGENT_CLASSES: dict[str, type[BaseAgent]] = {
+    "sequential": SequentialAgent,
+    "parallel": ParallelAgent,
+    "loop": LoopAgent,
+}
+
+
 class WorkflowHydrator:
     """Converts a WorkflowDef into an ADK agent tree.
 
@@ -47,6 +65,8 @@ class WorkflowHydrator:
     parallel, or loop), callbacks, and planners.
     """
 
+    __slots__ = ("_tool_registry",)
+
     def __init__(self, tool_registry: ToolRegistry) -> None:
         self._tool_registry = tool_registry
 
@@ -57,6 +77,15 @@ class WorkflowHydrator:
         # 2. Build orchestration wrapper
         return self._build_orchestration(workflow, agents)
 
+    # Leaf builder method names by AgentConfig.type. Looked up with getattr so
+    # subclass overrides are honoured.
+    _LEAF_BUILDERS: ClassVar[dict[str, str]] = {
+        "llm": "_build_llm_agent",
+        "code": "_build_code_agent",
+        "tool": "_build_tool_agent",
+        "expr": "_build_expr_agent",
+    }
+
     def _build_all_agents(self, configs: list[AgentConfig]) -> dict[str, BaseAgent]:
         """Build all agents, resolving sub_agents and agent_tools references.
 
@@ -68,19 +97,13 @@ class WorkflowHydrator:
 
         # First pass: build leaf agents (no sub_agent dependencies)
         for config in configs:
-            match config.type:
-                case "llm":
-                    agents[config.name] = self._build_llm_agent(config)
-                case "code":
-                    agents[config.name] = self._build_code_agent(config)
-                case "tool":
-                    agents[config.name] = self._build_tool_agent(config)
-                case "expr":
-                    agents[config.name] = self._build_expr_agent(config)
+            builder = self._LEAF_BUILDERS.get(config.type)
+            if builder is not None:
+                agents[config.name] = getattr(self, builder)(config)
 
         # Second pass: build workflow agents (may reference other agents)
         for config in configs:
-            if config.type in ("sequential", "parallel", "loop"):
+            if config.type in _WORKFLOW_AGENT_CLASSES:
                 agents[config.name] = self._build_workflow_agent(config, agents)
 
         # Third pass: wrap referenced agents as AgentTool
@@ -96,7 +119,6 @@ class WorkflowHydrator:
     def _build_llm_agent(self, config: AgentConfig) -> LlmAgent:
         """Build an LlmAgent with resolved tools, model, and optional callbacks."""
         model: Union[str, BaseLlm] = self._resolve_model(config.model)
-        tools = self._tool_registry.resolve_tools(config.tools) if config.tools else []
 
         callbacks = self._resolve_callbacks(config.callbacks)
 
@@ -106,9 +128,10 @@ class WorkflowHydrator:
             "name": config.name,
             "model": model,
             "instruction": instruction,
-            "tools": tools,
             **callbacks,
         }
+        if config.tools:
+            kwargs["tools"] = self._tool_registry.resolve_tools(config.tools)
         if config.output_key:
             kwargs["output_key"] = config.output_key
         if config.description:
@@ -159,78 +182,98 @@ class WorkflowHydrator:
 
     def _build_workflow_agent(self, config: AgentConfig, agents: dict[str, BaseAgent]) -> BaseAgent:
         """Build a workflow agent (sequential/parallel/loop) from AgentConfig."""
+        agent_cls = _WORKFLOW_AGENT_CLASSES.get(config.type)
+        if agent_cls is None:
+            raise ValueError(f"Unsupported workflow agent type: {config.type}")
         sub = [agents[name] for name in (config.sub_agents or [])]
-
-        match config.type:
-            case "sequential":
-                return SequentialAgent(name=config.name, sub_agents=sub)
-            case "parallel":
-                return ParallelAgent(name=config.name, sub_agents=sub)
-            case "loop":
-                return LoopAgent(name=config.name, sub_agents=sub)
-            case _:
-                raise ValueError(f"Unsupported workflow agent type: {config.type}")
+        return agent_cls(name=config.name, sub_agents=sub)
+
+    # Orchestration builder method names by OrchestrationConfig.type, looked up
+    # the same way.
+    _ORCHESTRATION_BUILDERS: ClassVar[dict[str, str]] = {
+        "sequential": "_orchestrate_sequential",
+        "parallel": "_orchestrate_parallel",
+        "loop": "_orchestrate_loop",
+        "react": "_orchestrate_react",
+        "dag": "_orchestrate_dag",
+        "llm_routed": "_orchestrate_llm_routed",
+    }
 
     def _build_orchestration(
         self, workflow: WorkflowDef, agents: dict[str, BaseAgent]
     ) -> BaseAgent:
         """Build the top-level orchestration wrapper from the workflow definition."""
+        builder = self._ORCHESTRATION_BUILDERS.get(workflow.orchestration.type)
+        if builder is None:
+            raise ValueError(f"Unsupported orchestration type: {workflow.orchestration.type}")
+        return getattr(self, builder)(workflow, agents)
+
+    def _orchestrate_sequential(
+        self, workflow: WorkflowDef, agents: dict[str, BaseAgent]
+    ) -> BaseAgent:
+        return SequentialAgent(
+            name=workflow.name,
+            sub_agents=[agents[n] for n in (workflow.orchestration.agents or [])],
+        )
+
+    def _orchestrate_parallel(
+        self, workflow: WorkflowDef, agents: dict[str, BaseAgent]
+    ) -> BaseAgent:
+        return ParallelAgent(
+            name=workflow.name,
+            sub_agents=[agents[n] for n in (workflow.orchestration.agents or [])],
+        )
+
+    def _orchestrate_loop(self, workflow: WorkflowDef, agents: dict[str, BaseAgent]) -> BaseAgent:
         orch = workflow.orchestration
+        kwargs: dict = {
+            "name": workflow.name,
+            "sub_agents": [agents[n] for n in (orch.agents or [])],
+        }
+        if orch.max_iterations is not None:
+            kwargs["max_iterations"] = orch.max_iterations
+        return LoopAgent(**kwargs)
 
-        match orch.type:
-            case "sequential":
-                return SequentialAgent(
-                    name=workflow.name,
-                    sub_agents=[agents[n] for n in (orch.agents or [])],
-                )
-            case "parallel":
-                return ParallelAgent(
-                    name=workflow.name,
-                    sub_agents=[agents[n] for n in (orch.agents or [])],
-                )
-            case "loop":
-                kwargs: dict = {
-                    "name": workflow.name,
-                    "sub_agents": [agents[n] for n in (orch.agents or [])],
-                }
-                if orch.max_iterations is not None:
-                    kwargs["max_iterations"] = orch.max_iterations
-                return LoopAgent(**kwargs)
-            case "react":
-                if not orch.agent:
-                    raise ValueError("react orchestration requires 'agent'")
-                agent = agents[orch.agent]
-                planner = self._resolve_planner(orch.planner, orch.planner_config)
-                if planner is not None:
-                    agent.planner = planner
-                return agent
-            case "dag":
-                if not orch.nodes:
-                    raise ValueError("dag orchestration requires 'nodes'")
-                dag_nodes = [
-                    DagNodeRuntime(
-                        name=node.agent,
-                        agent=agents[node.agent],
-                        depends_on=set(node.depends_on),
-                    )
-                    for node in orch.nodes
-                ]
-                return DagAgent(
-                    name=workflow.name,
-                    dag_nodes=dag_nodes,
-                    sub_agents=[agents[node.agent] for node in orch.nodes],
-                )
-            case "llm_routed":
-                if not orch.router:
-                    raise ValueError("llm_routed orchestration requires 'router'")
-                if not orch.agents:
-                    raise ValueError("llm_routed orchestration requires 'agents'")
-                router = agents[orch.router]
-                available = [agents[n] for n in orch.agents]
-                router.sub_agents = available
-                return router
-            case _:
-                raise ValueError(f"Unsupported orchestration type: {orch.type}")
+    def _orchestrate_react(self, workflow: WorkflowDef, agents: dict[str, BaseAgent]) -> BaseAgent:
+        orch = workflow.orchestration
+        if not orch.agent:
+            raise ValueError("react orchestration requires 'agent'")
+        agent = agents[orch.agent]
+        planner = self._resolve_planner(orch.planner, orch.planner_config)
+        if planner is not None:
+            agent.planner = planner
+        return agent
+
+    def _orchestrate_dag(self, workflow: WorkflowDef, agents: dict[str, BaseAgent]) -> BaseAgent:
+        orch = workflow.orchestration
+        if not orch.nodes:
+            raise ValueError("dag orchestration requires 'nodes'")
+        dag_nodes = [
+            DagNodeRuntime(
+                name=node.agent,
+                agent=agents[node.agent],
+                depends_on=frozenset(node.depends_on),
+            )
+            for node in orch.nodes
+        ]
+        return DagAgent(
+            name=workflow.name,
+            dag_nodes=dag_nodes,
+            sub_agents=[agents[node.agent] for node in orch.nodes],
+        )
+
+    def _orchestrate_llm_routed(
+        self, workflow: WorkflowDef, agents: dict[str, BaseAgent]
+    ) -> BaseAgent:
+        orch = workflow.orchestration
+        if not orch.router:
+            raise ValueError("llm_routed orchestration requires 'router'")
+        if not orch.agents:
+            raise ValueError("llm_routed orchestration requires 'agents'")
+        router = agents[orch.router]
+        available = [agents[n] for n in orch.agents]
+        router.sub_agents = available
+        return router
 
     def _resolve_model(self, model_string: str | None) -> Union[str, BaseLlm]:
         """Resolve model string to ADK model.
@@ -240,9 +283,8 @@ class WorkflowHydrator:
         """
         if not model_string:
             return ""
-        if model_string.startswith(("anthropic/", "openai/")):
-            cls = _get_litellm()
-            return cls(model=model_string)
+        if model_string.startswith(_LITELLM_PREFIXES):
+            return _make_litellm_model(model_string)
         return model_string
 
     def _resolve_callbacks(self, callbacks: dict[str, str] | None) -> dict:
@@ -319,23 +361,22 @@ def build_root_agent(caller_file: str) -> BaseAgent:
     """Build an ADK root_agent from the workflow.yaml next to caller_file.
 
     Convenience factory for agent packages — replaces identical boilerplate
-    across all packages with a single function call.
+    across all packages with a single function call. Every call returns a
+    freshly hydrated agent. Unchanged YAML files skip parsing
+    (``load_yaml_file``), and OpenAPI toolsets are reused through their own
+    spec- and auth-keyed cache.
 
     Usage in agent packages::
 
         from pyflow.platform.hydration.hydrator import build_root_agent
         root_agent = build_root_agent(__file__)
     """
-    from pyflow.platform.registry.tool_registry import ToolRegistry
-
     workflow_dir = Path(caller_file).parent
     workflow_path = workflow_dir / "workflow.yaml"
     # project_root = grandparent of agent package (agents/<name>/ -> project root)
     project_root = workflow_dir.parent.parent
     tools = ToolRegistry()
     tools.discover()
-    from pyflow.models.project import ProjectConfig
-
     workflow = WorkflowDef.from_yaml(workflow_path)
     project_config = ProjectConfig.from_yaml(project_root / "pyflow.yaml")
     if project_config.openapi_tools:
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import functools
+import json
 from typing import Any
 
 from pydantic import BaseModel, create_model
@@ -24,7 +26,23 @@ def json_schema_to_pydantic(
     - Nested objects (recursively converted)
     - Arrays with typed items (list[T])
     - Required vs optional fields (optional get ``None`` default)
+
+    Models are cached per (schema, model_name), so re-hydrating the same
+    workflow reuses the class and its compiled validator.
     """
+    try:
+        key = json.dumps(schema, sort_keys=True)
+    except (TypeError, ValueError):
+        return _build_model(schema, model_name)
+    return _build_model_cached(key, model_name)
+
+
+@functools.lru_cache(maxsize=256)
+def _build_model_cached(schema_json: str, model_name: str) -> type[BaseModel]:
+    return _build_model(json.loads(schema_json), model_name)
+
+
+def _build_model(schema: dict[str, Any], model_name: str) -> type[BaseModel]:
     properties = schema.get("properties", {})
     required = set(schema.get("required", []))
     fields: dict[str, Any] = {}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 
@@ -9,9 +10,11 @@ def scan_agent_packages(path: Path) -> list[Path]:
     Returns a sorted list of package directory Paths. If the directory does
     not exist, returns an empty list.
     """
-    if not path.exists():
+    # scandir entries carry the file type from the directory listing, so
+    # is_dir() needs no extra stat call per entry.
+    try:
+        with os.scandir(path) as entries:
+            dirs = [entry.path for entry in entries if entry.is_dir()]
+    except FileNotFoundError:
         return []
-    return sorted(
-        d for d in path.iterdir()
-        if d.is_dir() and (d / "workflow.yaml").exists()
-    )
+    return sorted(Path(d) for d in dirs if os.path.exists(os.path.join(d, "workflow.yaml")))
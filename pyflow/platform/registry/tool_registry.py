@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import functools
+import hashlib
 import importlib
 import inspect
+import os
 from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -10,6 +13,7 @@ import structlog
 
 from google.adk.tools import FunctionTool
 
+from pyflow.models.agent import OpenApiToolConfig
 from pyflow.models.tool import ToolMetadata
 from pyflow.platform.openapi_auth import resolve_openapi_auth
 from pyflow.tools.base import BasePlatformTool
@@ -21,8 +25,6 @@ if TYPE_CHECKING:
     from google.adk.tools.base_toolset import BaseToolset
     from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_toolset import OpenAPIToolset
 
-    from pyflow.models.agent import OpenApiToolConfig
-
 # ADK built-in tools available by name in workflow YAML.
 # Most are pre-instantiated tool objects (not FunctionTool), returned directly via lazy import.
 _ADK_BUILTIN_TOOLS: dict[str, Callable] = {
@@ -49,12 +51,64 @@ def _lazy_import_builtin(module_path: str, attr: str):
     return getattr(mod, attr)
 
 
+def _auth_env_fingerprint(cfg: OpenApiToolConfig) -> str:
+    """Hash the env var values the auth config reads, so rotated secrets rebuild the toolset."""
+    auth = cfg.auth
+    env_names = (
+        auth.token_env,
+        auth.client_id_env,
+        auth.client_secret_env,
+        auth.service_account_env,
+    )
+    values = "\0".join(os.environ.get(env or "", "") for env in env_names)
+    return hashlib.sha256(values.encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=64)
+def _load_openapi_toolset(
+    spec_path: str, mtime_ns: int, size: int, config_json: str, auth_key: str
+) -> OpenAPIToolset:
+    """Read and parse an OpenAPI spec into a toolset.
+
+    ``mtime_ns``, ``size`` and ``auth_key`` only key the cache, so an edited
+    spec file or changed credentials are picked up on the next registration.
+    """
+    from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_toolset import (
+        OpenAPIToolset,
+    )
+
+    cfg = OpenApiToolConfig.model_validate_json(config_json)
+    path = Path(spec_path)
+    spec_type = "json" if path.suffix == ".json" else "yaml"
+    auth_scheme, auth_credential = resolve_openapi_auth(cfg.auth)
+    kwargs: dict = {
+        "spec_str": path.read_text(),
+        "spec_str_type": spec_type,
+    }
+    if auth_scheme is not None:
+        kwargs["auth_scheme"] = auth_scheme
+    if auth_credential is not None:
+        kwargs["auth_credential"] = auth_credential
+    if cfg.name_prefix is not None:
+        kwargs["tool_name_prefix"] = cfg.name_prefix
+    if cfg.tool_filter is not None:
+        if isinstance(cfg.tool_filter, list):
+            kwargs["tool_filter"] = cfg.tool_filter
+        else:
+            from pyflow.platform.callbacks import resolve_tool_predicate
+
+            kwargs["tool_filter"] = resolve_tool_predicate(cfg.tool_filter)
+    return OpenAPIToolset(**kwargs)
+
+
 class ToolRegistry:
     """Registry for platform tools with auto-discovery and ADK integration."""
 
     def __init__(self) -> None:
         self._tools: dict[str, type[BasePlatformTool]] = {}
         self._openapi_tools: dict[str, OpenAPIToolset] = {}
+        # resolve_tools results per distinct ref list; cleared whenever a tool is registered
+        self._resolved: dict[tuple, list] = {}
 
     def discover(self) -> None:
         """Import pyflow.tools to trigger auto-registration, then collect all registered tools."""
@@ -63,10 +117,12 @@ class ToolRegistry:
         from pyflow.tools.base import get_registered_tools
 
         self._tools.update(get_registered_tools())
+        self._resolved.clear()
 
     def register(self, tool_cls: type[BasePlatformTool]) -> None:
         """Manually register a tool class."""
         self._tools[tool_cls.name] = tool_cls
+        self._resolved.clear()
 
     def register_openapi_tools(
         self, configs: dict[str, OpenApiToolConfig], base_dir: Path
@@ -75,35 +131,20 @@ class ToolRegistry:
 
         Each config is keyed by tool name (e.g. 'ynab') and contains the spec
         path and auth settings. The spec is read once and the toolset is cached
-        for resolution via get_tool_union().
+        for resolution via get_tool_union(). Toolsets are also shared across
+        registries until the spec file, the config or the auth env vars change.
         """
-        from google.adk.tools.openapi_tool.openapi_spec_parser.openapi_toolset import (
-            OpenAPIToolset,
-        )
-
         for name, cfg in configs.items():
-            spec_path = base_dir / cfg.spec
-            spec_str = spec_path.read_text()
-            spec_type = "json" if spec_path.suffix == ".json" else "yaml"
-            auth_scheme, auth_credential = resolve_openapi_auth(cfg.auth)
-            kwargs: dict = {
-                "spec_str": spec_str,
-                "spec_str_type": spec_type,
-            }
-            if auth_scheme is not None:
-                kwargs["auth_scheme"] = auth_scheme
-            if auth_credential is not None:
-                kwargs["auth_credential"] = auth_credential
-            if cfg.name_prefix is not None:
-                kwargs["tool_name_prefix"] = cfg.name_prefix
-            if cfg.tool_filter is not None:
-                if isinstance(cfg.tool_filter, list):
-                    kwargs["tool_filter"] = cfg.tool_filter
-                else:
-                    from pyflow.platform.callbacks import resolve_tool_predicate
-
-                    kwargs["tool_filter"] = resolve_tool_predicate(cfg.tool_filter)
-            self._openapi_tools[name] = OpenAPIToolset(**kwargs)
+            spec_path = (base_dir / cfg.spec).resolve()
+            stat = spec_path.stat()
+            self._openapi_tools[name] = _load_openapi_toolset(
+                str(spec_path),
+                stat.st_mtime_ns,
+                stat.st_size,
+                cfg.model_dump_json(),
+                _auth_env_fingerprint(cfg),
+            )
+        self._resolved.clear()
 
     def get(self, name: str) -> BasePlatformTool:
         """Get a tool instance by name. Raises KeyError if not found."""
@@ -170,7 +211,23 @@ class ToolRegistry:
         Each ref is either a string (resolved via get_tool_union) or a dict
         like ``{"ynab": ["get*"]}`` which wraps the named OpenAPI toolset
         in a FilteredToolset with fnmatch glob patterns.
+
+        Results are cached per distinct ref list, so agents (and workflows)
+        declaring the same tools share tool objects. Each call returns a new
+        list that the caller may extend.
         """
+        key = tuple(
+            ref if isinstance(ref, str) else tuple((k, tuple(v)) for k, v in ref.items())
+            for ref in tool_refs
+        )
+        cached = self._resolved.get(key)
+        if cached is None:
+            cached = self._resolved[key] = self._resolve_uncached(tool_refs)
+        return list(cached)
+
+    def _resolve_uncached(
+        self, tool_refs: list[str | dict[str, list[str]]]
+    ) -> list[FunctionTool | BaseTool | BaseToolset | Callable]:
         from pyflow.platform.filtered_toolset import FilteredToolset
 
         result = []
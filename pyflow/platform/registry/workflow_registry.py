@@ -3,10 +3,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-import yaml
 from pydantic import BaseModel, ConfigDict
 
 from pyflow.models.workflow import WorkflowDef
+from pyflow.models.yaml_loader import safe_load_yaml
 from pyflow.platform.registry.discovery import scan_agent_packages
 
 if TYPE_CHECKING:
@@ -39,7 +39,7 @@ class WorkflowRegistry:
 
     def _load_yaml(self, path: Path) -> WorkflowDef:
         """Load and validate a YAML file into a WorkflowDef."""
-        data = yaml.safe_load(path.read_text())
+        data = safe_load_yaml(path.read_text())
         return WorkflowDef(**data)
 
     def register(self, workflow: WorkflowDef) -> None:
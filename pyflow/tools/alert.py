@@ -4,6 +4,7 @@ import httpx
 from google.adk.tools.tool_context import ToolContext
 
 from pyflow.tools.base import BasePlatformTool
+from pyflow.tools.client import get_client
 from pyflow.tools.security import is_private_url
 
 
@@ -32,13 +33,12 @@ class AlertTool(BasePlatformTool):
             }
 
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.post(webhook_url, json={"message": message})
-                return {
-                    "status": "success",
-                    "status_code": resp.status_code,
-                    "sent": True,
-                    "error": None,
-                }
+            resp = await get_client().post(webhook_url, json={"message": message}, timeout=30)
         except httpx.HTTPError as exc:
             return {"status": "error", "status_code": 0, "sent": False, "error": str(exc)}
+        return {
+            "status": "success",
+            "status_code": resp.status_code,
+            "sent": True,
+            "error": None,
+        }
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import http.cookiejar
+import ipaddress
+import ssl
+import typing
+import urllib.request
+import weakref
+
+import httpcore
+import httpx
+
+from pyflow.tools import security
+
+
+class SSRFBlockedError(httpx.ConnectError):
+    """Raised when a connection would be dialed to a private/internal address."""
+
+
+class _PinnedNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that dials exactly the addresses it validated.
+
+    The hostname is resolved once through the SSRF resolver, every address is
+    checked, and the TCP connection is opened to the resolved IP. The socket
+    layer never performs a second DNS lookup, so a rebinding DNS server cannot
+    swap in a private address between the check and the connect. TLS still
+    uses the original hostname for SNI and certificate verification.
+    """
+
+    def __init__(self, inner: httpcore.AsyncNetworkBackend | None = None) -> None:
+        self._inner = inner or httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        try:
+            addrs = await asyncio.to_thread(security._resolve_host, host.strip("[]"))
+        except OSError as exc:
+            raise httpcore.ConnectError(str(exc)) from exc
+        if not addrs or any(security._is_blocked_ip(addr) for addr in addrs):
+            raise SSRFBlockedError(f"SSRF blocked: private/internal URL ({host})")
+
+        last_exc: Exception | None = None
+        for addr in addrs:
+            try:
+                return await self._inner.connect_tcp(
+                    str(addr),
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+            except httpcore.ConnectError as exc:
+                last_exc = exc
+        assert last_exc is not None
+        raise last_exc
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: typing.Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._inner.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        await self._inner.sleep(seconds)
+
+
+# httpcore errors and the httpx errors they surface as; subclasses come first
+# because the first match wins.
+_HTTPCORE_EXC_MAP: tuple[tuple[type[Exception], type[httpx.TransportError]], ...] = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+@contextlib.contextmanager
+def _map_httpcore_exceptions() -> typing.Iterator[None]:
+    """Re-raise httpcore errors as their httpx equivalents, as httpx's transport does."""
+    try:
+        yield
+    except Exception as exc:
+        for core_exc, httpx_exc in _HTTPCORE_EXC_MAP:
+            if isinstance(exc, core_exc):
+                raise httpx_exc(str(exc)) from exc
+        raise
+
+
+class _PinnedResponseStream(httpx.AsyncByteStream):
+    """Response body read from the httpcore pool, with errors mapped to httpx."""
+
+    def __init__(self, stream: typing.AsyncIterable[bytes]) -> None:
+        self._stream = stream
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        with _map_httpcore_exceptions():
+            async for chunk in self._stream:
+                yield chunk
+
+    async def aclose(self) -> None:
+        if hasattr(self._stream, "aclose"):
+            with _map_httpcore_exceptions():
+                await self._stream.aclose()
+
+
+class PinnedTransport(httpx.AsyncBaseTransport):
+    """httpx transport whose connections are pinned to SSRF-validated IPs.
+
+    Owns an ``httpcore.AsyncConnectionPool`` that dials through
+    ``_PinnedNetworkBackend`` and maps requests, responses and errors between
+    httpx and httpcore the way ``httpx.AsyncHTTPTransport`` does.
+    """
+
+    def __init__(
+        self,
+        network_backend: httpcore.AsyncNetworkBackend | None = None,
+        *,
+        verify: ssl.SSLContext | bool = True,
+        trust_env: bool = True,
+        limits: httpx.Limits | None = None,
+    ) -> None:
+        limits = limits or httpx.Limits()
+        self._pool = httpcore.AsyncConnectionPool(
+            ssl_context=httpx.create_ssl_context(verify=verify, trust_env=trust_env),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            network_backend=_PinnedNetworkBackend(network_backend),
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        assert isinstance(request.stream, httpx.AsyncByteStream)
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _map_httpcore_exceptions():
+            core_response = await self._pool.handle_async_request(core_request)
+
+        assert isinstance(core_response.stream, typing.AsyncIterable)
+        return httpx.Response(
+            status_code=core_response.status,
+            headers=core_response.headers,
+            stream=_PinnedResponseStream(core_response.stream),
+            extensions=core_response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+class _ProxyTransport(httpx.AsyncHTTPTransport):
+    """httpx transport for requests sent through an environment proxy.
+
+    The proxy resolves and dials the target itself, so the connection cannot
+    be pinned. Instead the target is resolved here and refused if any address
+    is private; a DNS answer that changes before the proxy looks it up is not
+    caught. Targets that do not resolve locally are left to the proxy.
+    """
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        try:
+            addrs = await asyncio.to_thread(security._resolve_host, host)
+        except OSError:
+            addrs = ()
+        if any(security._is_blocked_ip(addr) for addr in addrs):
+            raise SSRFBlockedError(f"SSRF blocked: private/internal URL ({host})", request=request)
+        return await super().handle_async_request(request)
+
+
+class _DiscardingCookieJar(http.cookiejar.CookieJar):
+    """Cookie jar that never stores cookies.
+
+    The shared clients serve every workflow and user in the process, so a
+    ``Set-Cookie`` from one response must not ride along on later requests.
+    """
+
+    def set_cookie(self, cookie: http.cookiejar.Cookie) -> None:
+        pass
+
+    def extract_cookies(self, response: typing.Any, request: typing.Any) -> None:
+        pass
+
+
+# Shared across tool instances so keep-alive connections and TLS sessions are reused.
+_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=30.0)
+
+
+def _no_proxy_pattern(host: str) -> str:
+    """Turn a NO_PROXY entry into an httpx mount pattern, as httpx does."""
+    if "://" in host:
+        return host
+    try:
+        addr = ipaddress.ip_address(host)
+    except ValueError:
+        return "all://localhost" if host.lower() == "localhost" else f"all://*{host.lstrip('.')}"
+    return f"all://[{host}]" if addr.version == 6 else f"all://{host}"
+
+
+def _env_proxy_mounts() -> dict[str, httpx.AsyncBaseTransport | None]:
+    """Mount ``_ProxyTransport`` for HTTP_PROXY/HTTPS_PROXY/ALL_PROXY, honoring NO_PROXY.
+
+    httpx ignores environment proxies once a transport is passed, so the pinned
+    client mounts them itself. A ``None`` mount sends matching URLs through the
+    client's own (pinned) transport.
+    """
+    proxies = urllib.request.getproxies()
+    no_proxy = [host.strip() for host in proxies.get("no", "").split(",") if host.strip()]
+    if "*" in no_proxy:
+        return {}
+    mounts: dict[str, httpx.AsyncBaseTransport | None] = {}
+    for scheme in ("all", "http", "https"):
+        proxy = proxies.get(scheme)
+        if proxy:
+            if "://" not in proxy:
+                proxy = f"http://{proxy}"
+            mounts[f"{scheme}://"] = _ProxyTransport(proxy=proxy, limits=_LIMITS)
+    if mounts:
+        mounts.update((_no_proxy_pattern(host), None) for host in no_proxy)
+    return mounts
+
+
+# Connection pools are bound to an event loop, so clients are kept per loop.
+_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[bool, httpx.AsyncClient]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_client(*, pinned: bool = True) -> httpx.AsyncClient:
+    """Return the shared AsyncClient for the running event loop.
+
+    ``pinned`` selects the client that connects through ``PinnedTransport``;
+    the unpinned client is only for callers that explicitly allow private
+    addresses. Each loop gets its own clients (a closed client is replaced),
+    and they never store cookies. Pass timeouts per request.
+
+    Both clients honor the environment proxy variables. The pinned client
+    sends proxied requests through ``_ProxyTransport``, which checks the
+    target before the proxy dials it.
+    """
+    loop_clients = _clients.setdefault(asyncio.get_running_loop(), {})
+    client = loop_clients.get(pinned)
+    if client is None or client.is_closed:
+        if pinned:
+            client = httpx.AsyncClient(
+                limits=_LIMITS,
+                transport=PinnedTransport(limits=_LIMITS),
+                mounts=_env_proxy_mounts(),
+                cookies=_DiscardingCookieJar(),
+            )
+        else:
+            client = httpx.AsyncClient(limits=_LIMITS, cookies=_DiscardingCookieJar())
+        loop_clients[pinned] = client
+    return client
+
+
+async def aclose_clients() -> None:
+    """Close the running loop's shared clients; the next ``get_client`` creates new ones.
+
+    Clients of other loops stay registered until that loop closes them or is
+    garbage collected.
+    """
+    clients = _clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.aclose()
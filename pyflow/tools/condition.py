@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import ast
+import functools
+from types import CodeType
 
 from google.adk.tools.tool_context import ToolContext
 
@@ -70,8 +72,11 @@ _SAFE_BUILTINS = {
 }
 
 
-def _validate_ast(expression: str) -> None:
-    """Parse and validate an expression AST, raising ValueError if unsafe."""
+def _validate_ast(expression: str) -> ast.Expression:
+    """Parse and validate an expression AST, raising ValueError if unsafe.
+
+    Returns the parsed tree so callers can compile it without re-parsing.
+    """
     tree = ast.parse(expression, mode="eval")
     for child in ast.walk(tree):
         # Reject import nodes
@@ -90,6 +95,24 @@ def _validate_ast(expression: str) -> None:
         # Reject dunder attribute access
         if isinstance(child, ast.Attribute) and child.attr.startswith("__"):
             raise ValueError(f"Access to '{child.attr}' is not allowed")
+    return tree
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_expression(expression: str) -> tuple[ast.Expression, CodeType]:
+    """Validate and compile an expression, cached per source string.
+
+    Returns the validated tree (shared; do not mutate it) with its code
+    object. Raises ValueError (unsafe) or SyntaxError like ``_validate_ast``;
+    failures are not cached.
+    """
+    tree = _validate_ast(expression)
+    return tree, compile(tree, "<expr>", "eval")
+
+
+def _compile_expression(expression: str) -> CodeType:
+    """Validate and compile an expression; see ``_parse_expression``."""
+    return _parse_expression(expression)[1]
 
 
 class ConditionTool(BasePlatformTool):
@@ -103,14 +126,14 @@ class ConditionTool(BasePlatformTool):
             expression: A Python boolean expression (e.g. '1 + 1 == 2', 'x > 5 and y < 10').
         """
         try:
-            _validate_ast(expression)
+            code = _compile_expression(expression)
         except (ValueError, SyntaxError) as exc:
             return {"status": "error", "result": False, "error": str(exc)}
 
         try:
             # Security: AST validation above is the actual security boundary,
             # not the restricted builtins alone.
-            result = bool(eval(expression, {"__builtins__": _SAFE_BUILTINS}))  # noqa: S307
+            result = bool(eval(code, {"__builtins__": _SAFE_BUILTINS}))  # noqa: S307
             return {"status": "success", "result": result, "error": None}
         except Exception as exc:
             return {"status": "error", "result": False, "error": f"Evaluation error: {exc}"}
@@ -4,6 +4,7 @@ import httpx
 from google.adk.tools.tool_context import ToolContext
 
 from pyflow.tools.base import BasePlatformTool
+from pyflow.tools.client import get_client
 from pyflow.tools.parsing import safe_json_parse
 from pyflow.tools.security import is_private_url
 
@@ -32,6 +33,8 @@ class HttpTool(BasePlatformTool):
             timeout: Request timeout in seconds (1-300).
             allow_private: Allow requests to private network addresses.
         """
+        # Literal hosts are rejected up front; hostnames are resolved and
+        # validated once, at connect time, by the pinned client's transport.
         if not allow_private and is_private_url(url):
             return {
                 "status": "error",
@@ -44,23 +47,24 @@ class HttpTool(BasePlatformTool):
         parsed_body = safe_json_parse(body)
 
         try:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                resp = await client.request(
-                    method=method.upper(),
-                    url=url,
-                    headers=parsed_headers,
-                    json=parsed_body if parsed_body is not None else None,
-                )
-                try:
-                    resp_body = resp.json()
-                except Exception:
-                    resp_body = resp.text
-                return {
-                    "status": "success",
-                    "status_code": resp.status_code,
-                    "headers": dict(resp.headers),
-                    "body": resp_body,
-                    "error": None,
-                }
+            resp = await get_client(pinned=not allow_private).request(
+                method=method.upper(),
+                url=url,
+                headers=parsed_headers,
+                json=parsed_body if parsed_body is not None else None,
+                timeout=timeout,
+            )
         except httpx.HTTPError as exc:
             return {"status": "error", "status_code": 0, "error": str(exc)}
+
+        try:
+            resp_body = resp.json()
+        except Exception:
+            resp_body = resp.text
+        return {
+            "status": "success",
+            "status_code": resp.status_code,
+            "headers": dict(resp.headers),
+            "body": resp_body,
+            "error": None,
+        }
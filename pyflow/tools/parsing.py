@@ -1,14 +1,41 @@
 from __future__ import annotations
 
 import json
+import re
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# A run of 19+ digits may be an integer beyond 64 bits, which orjson turns into a float.
+_LONG_DIGITS = re.compile(r"\d{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"\d{19}")
+
+
+def json_loads(value: str | bytes) -> Any:
+    """Decode JSON, using orjson when installed. Raises ValueError on bad input.
+
+    Both backends return what ``json.loads`` returns: input orjson would
+    change (integers beyond 64 bits) or reject (NaN, Infinity, out-of-range
+    floats, lone surrogates) is decoded by ``json.loads`` instead.
+    """
+    if orjson is not None:
+        pattern = _LONG_DIGITS_BYTES if isinstance(value, bytes) else _LONG_DIGITS
+        if pattern.search(value) is None:
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(value)
+
 
 def safe_json_parse(value: str | None, default: Any = None) -> Any:
     """Parse JSON string safely, return default on failure."""
     if not value:
         return default
     try:
-        return json.loads(value)
-    except (json.JSONDecodeError, TypeError):
+        return json_loads(value)
+    except (ValueError, TypeError):
         return default
@@ -1,21 +1,102 @@
 from __future__ import annotations
 
 import ipaddress
+import socket
+import time
 from urllib.parse import urlparse
 
+IPAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
+
+# Hostnames that name the local machine without needing DNS (RFC 6761 and
+# common /etc/hosts aliases). Subdomains of "localhost" are blocked as well.
+_BLOCKED_HOSTNAMES = frozenset({"localhost", "ip6-localhost", "ip6-loopback"})
+
+# Resolved addresses are reused for this many seconds after each lookup.
+_DNS_TTL = 15
+_DNS_CACHE_SIZE = 1024
+# host -> (addresses, monotonic expiry); insertion order gives oldest-first eviction.
+_dns_cache: dict[str, tuple[tuple[IPAddress, ...], float]] = {}
+
+
+def _resolve_host(host: str) -> tuple[IPAddress, ...]:
+    """Resolve host to its unique IP addresses, cached for ``_DNS_TTL`` seconds.
+
+    Each entry expires ``_DNS_TTL`` seconds after its own lookup, so hosts do
+    not all re-resolve at once. Raises OSError (``socket.gaierror``) if the
+    host cannot be resolved; failures are not cached.
+    """
+    now = time.monotonic()
+    cached = _dns_cache.get(host)
+    if cached is not None and now < cached[1]:
+        return cached[0]
+
+    infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    addrs = tuple(dict.fromkeys(ipaddress.ip_address(info[4][0]) for info in infos))
+    _dns_cache.pop(host, None)
+    if len(_dns_cache) >= _DNS_CACHE_SIZE:
+        _dns_cache.pop(next(iter(_dns_cache), None), None)
+    _dns_cache[host] = (addrs, now + _DNS_TTL)
+    return addrs
+
+
+def _network_table(*cidrs: str) -> tuple[tuple[int, int], ...]:
+    """Precompute ``(network_int, mask_int)`` pairs for integer-AND matching."""
+    networks = [ipaddress.ip_network(cidr) for cidr in cidrs]
+    return tuple((int(net.network_address), int(net.netmask)) for net in networks)
+
+
+# Everything ipaddress flags as private, loopback, link-local or reserved,
+# plus carrier-grade NAT (100.64.0.0/10) and the whole IETF protocol
+# assignments block (192.0.0.0/24).
+_BLOCKED_V4 = _network_table(
+    "0.0.0.0/8",
+    "10.0.0.0/8",
+    "100.64.0.0/10",
+    "127.0.0.0/8",
+    "169.254.0.0/16",
+    "172.16.0.0/12",
+    "192.0.0.0/24",
+    "192.0.2.0/24",
+    "192.168.0.0/16",
+    "198.18.0.0/15",
+    "198.51.100.0/24",
+    "203.0.113.0/24",
+    "240.0.0.0/4",
+)
+
+# Only global unicast (2000::/3) is reachable, minus its special-purpose and
+# documentation blocks. The first entry also covers loopback, unspecified,
+# IPv4-mapped (::ffff:0:0/96) and NAT64 addresses.
+_BLOCKED_V6 = _network_table(
+    "::/3",
+    "4000::/2",
+    "8000::/1",
+    "2001::/23",
+    "2001:db8::/32",
+)
+
+
+def _is_blocked_ip(addr: IPAddress) -> bool:
+    value = int(addr)
+    for network, mask in _BLOCKED_V4 if addr.version == 4 else _BLOCKED_V6:
+        if value & mask == network:
+            return True
+    return False
+
 
 def is_private_url(url: str) -> bool:
-    """Check if URL points to a private/internal network address."""
-    parsed = urlparse(url)
-    hostname = parsed.hostname or ""
+    """Check if URL points to a private/internal network address.
 
-    if hostname in ("localhost", ""):
+    Only literal hosts (IP addresses and localhost names) are checked; this
+    never touches DNS. Hostnames are resolved and validated at connect time
+    by ``PinnedTransport`` in ``pyflow.tools.client``.
+    """
+    # urlparse lowercases the hostname; a trailing dot is the same DNS name.
+    clean = (urlparse(url).hostname or "").rstrip(".")
+    if not clean or clean in _BLOCKED_HOSTNAMES or clean.endswith(".localhost"):
         return True
 
-    clean = hostname.strip("[]")
-
     try:
-        addr = ipaddress.ip_address(clean)
-        return addr.is_private or addr.is_loopback or addr.is_link_local or addr.is_reserved
+        return _is_blocked_ip(ipaddress.ip_address(clean))
     except ValueError:
         return False
@@ -1,12 +1,48 @@
 from __future__ import annotations
 
 import json
+import os
+import uuid
 from pathlib import Path
 
 from google.adk.tools.tool_context import ToolContext
 
 from pyflow.tools.base import BasePlatformTool
-from pyflow.tools.parsing import safe_json_parse
+from pyflow.tools.parsing import json_loads, safe_json_parse
+
+# Files with this suffix hold one JSON record per line (JSON Lines).
+_JSONL_SUFFIX = ".jsonl"
+# safe_json_parse default marking data that is not JSON (``None`` is the valid ``null``).
+_NOT_JSON = object()
+
+
+def _atomic_write_text(path: Path, text: str) -> None:
+    """Write ``text`` to a temp file beside ``path`` and rename it into place.
+
+    Readers see either the old or the new file, never a partial write.
+    """
+    tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with tmp.open("x", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _parse_jsonl(content: str) -> tuple[list, list[int]]:
+    """Parse JSON Lines text into its records and the numbers of unparsable lines."""
+    records: list = []
+    invalid_lines: list[int] = []
+    for number, line in enumerate(content.splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            records.append(json_loads(line))
+        except ValueError:
+            invalid_lines.append(number)
+    return records, invalid_lines
 
 
 class StorageTool(BasePlatformTool):
@@ -26,6 +62,11 @@ class StorageTool(BasePlatformTool):
             path: File path to read/write/append.
             action: One of 'read', 'write', 'append'.
             data: Data to write/append (JSON string for structured data, plain text otherwise).
+
+        For ``.jsonl`` files, append adds ``data`` as one newline-terminated
+        JSON record without touching the rest of the file, and read also
+        returns the parsed ``records`` plus the 1-based ``invalid_lines``
+        that are not JSON (e.g. records appended without a newline).
         """
         file_path = Path(path)
         try:
@@ -36,21 +77,30 @@ class StorageTool(BasePlatformTool):
                         "content": None,
                         "error": "File not found",
                     }
-                return {
-                    "status": "success",
-                    "content": file_path.read_text(encoding="utf-8"),
-                    "error": None,
-                }
+                content = file_path.read_text(encoding="utf-8")
+                result = {"status": "success", "content": content, "error": None}
+                if file_path.suffix == _JSONL_SUFFIX:
+                    result["records"], result["invalid_lines"] = _parse_jsonl(content)
+                return result
             elif action == "write":
                 file_path.parent.mkdir(parents=True, exist_ok=True)
                 parsed = safe_json_parse(data)
                 text = json.dumps(parsed) if parsed is not None else data
-                file_path.write_text(text, encoding="utf-8")
+                _atomic_write_text(file_path, text)
                 return {"status": "success", "content": text, "error": None}
             elif action == "append":
                 file_path.parent.mkdir(parents=True, exist_ok=True)
-                parsed = safe_json_parse(data)
-                text = json.dumps(parsed) if parsed is not None else data
+                parsed = safe_json_parse(data, default=_NOT_JSON)
+                if file_path.suffix == _JSONL_SUFFIX:
+                    if parsed is _NOT_JSON:
+                        return {
+                            "status": "error",
+                            "content": None,
+                            "error": "JSON Lines append requires JSON data",
+                        }
+                    text = json.dumps(parsed) + "\n"
+                else:
+                    text = json.dumps(parsed) if parsed is not _NOT_JSON else data
                 with file_path.open("a", encoding="utf-8") as f:
                     f.write(text)
                 return {"status": "success", "content": text, "error": None}
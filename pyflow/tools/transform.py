@@ -1,10 +1,57 @@
 from __future__ import annotations
 
+import functools
+import re
+from collections.abc import Callable
+from typing import Any
+
 from google.adk.tools.tool_context import ToolContext
+from jsonpath_ng import parse as jp_parse
+from jsonpath_ng.lexer import JsonPathLexer
 
 from pyflow.tools.base import BasePlatformTool
 from pyflow.tools.parsing import safe_json_parse
 
+# Plain child/index chains such as ``$.data.users[0].name``.
+_SIMPLE_PATH_RE = re.compile(r"\$(?:\.[A-Za-z_][A-Za-z0-9_]*|\[[0-9]+\])+")
+_SIMPLE_STEP_RE = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\[([0-9]+)\]")
+
+
+def _walk_simple_path(steps: tuple[str | int, ...], data: Any) -> list[Any]:
+    """Resolve a plain path with direct lookups, matching jsonpath_ng results."""
+    for step in steps:
+        if isinstance(step, str):
+            if not isinstance(data, dict) or step not in data:
+                return []
+        elif not data or isinstance(data, dict):
+            # jsonpath_ng yields nothing for dicts and falsy values (None, 0, False)
+            return []
+        elif isinstance(data, (list, str)):
+            if step >= len(data):
+                return []
+        else:
+            raise TypeError(f"object of type '{type(data).__name__}' has no len()")
+        data = data[step]
+    return [data]
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_jsonpath(expression: str) -> Callable[[Any], list[Any]]:
+    """Compile a JSONPath expression once into a ``data -> matched values`` function.
+
+    Plain child/index chains skip jsonpath_ng entirely; anything else (wildcards,
+    filters, slices, reserved words) is parsed by jsonpath_ng.
+    """
+    if _SIMPLE_PATH_RE.fullmatch(expression):
+        steps = tuple(
+            int(index) if index else field for field, index in _SIMPLE_STEP_RE.findall(expression)
+        )
+        if not any(step in JsonPathLexer.reserved_words for step in steps):
+            return functools.partial(_walk_simple_path, steps)
+
+    path = jp_parse(expression)
+    return lambda data: [match.value for match in path.find(data)]
+
 
 class TransformTool(BasePlatformTool):
     name = "transform"
@@ -27,14 +74,12 @@ class TransformTool(BasePlatformTool):
             return {"status": "error", "result": None, "error": "Invalid JSON input"}
 
         try:
-            from jsonpath_ng import parse as jp_parse
-
-            matches = jp_parse(expression).find(parsed)
+            matches = _compile_jsonpath(expression)(parsed)
         except Exception as exc:
             return {"status": "error", "result": None, "error": f"JSONPath error: {exc}"}
 
         if not matches:
             return {"status": "success", "result": None, "error": None}
         if len(matches) == 1:
-            return {"status": "success", "result": matches[0].value, "error": None}
-        return {"status": "success", "result": [m.value for m in matches], "error": None}
+            return {"status": "success", "result": matches[0], "error": None}
+        return {"status": "success", "result": matches, "error": None}
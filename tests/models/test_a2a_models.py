@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import pytest
+from pydantic import ValidationError
 
 from pyflow.models.a2a import AgentCard
 from pyflow.models.workflow import SkillDef
@@ -37,6 +38,11 @@ class TestSkillDef:
         data = skill.model_dump()
         assert data == {"id": "s1", "name": "S1", "description": "desc", "tags": ["a"]}
 
+    def test_frozen(self):
+        skill = SkillDef(id="s1", name="S1")
+        with pytest.raises(ValidationError):
+            skill.name = "renamed"
+
 
 class TestAgentCard:
     def test_creation_with_all_fields(self):
@@ -85,6 +91,11 @@ class TestAgentCard:
         with pytest.raises(Exception):
             AgentCard(name="agent")
 
+    def test_frozen(self):
+        card = AgentCard(name="agent", url="http://localhost:8000/a2a/agent")
+        with pytest.raises(ValidationError):
+            card.url = "http://evil.example.com"
+
     def test_serialization(self):
         card = AgentCard(
             name="agent",
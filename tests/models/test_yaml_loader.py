@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from pyflow.models import yaml_loader
+from pyflow.models.yaml_loader import load_yaml_file, safe_load_yaml
+
+
+class TestSafeLoadYaml:
+    def test_uses_libyaml_when_available(self):
+        if not yaml.__with_libyaml__:
+            pytest.skip("PyYAML built without libyaml")
+        assert yaml_loader._SafeLoader is yaml.CSafeLoader
+
+    def test_matches_safe_load(self):
+        text = "name: wf\nagents:\n  - name: a\n    retries: 3\n    ratio: 0.5\nflag: yes\n"
+        assert safe_load_yaml(text) == yaml.safe_load(text)
+
+    def test_empty_document_is_none(self):
+        assert safe_load_yaml("") is None
+
+    def test_rejects_python_tags(self):
+        with pytest.raises(yaml.YAMLError):
+            safe_load_yaml("!!python/object/apply:os.system ['true']")
+
+    def test_json_document_skips_yaml_parser(self):
+        text = '{"name": "wf", "agents": [{"name": "a", "retries": 3}], "flag": true}'
+        with patch.object(yaml, "load") as yaml_load:
+            result = safe_load_yaml(text)
+        yaml_load.assert_not_called()
+        assert result == yaml.safe_load(text)
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"a": NaN, "b": Infinity, "c": -Infinity}',
+            '{"t": 1e-3, "u": 1.0e3, "v": 1E+3, "w": 1.0E+3, "x": 1.5, "y": -0.0}',
+            '[12345678901234567890123, -0, "\\/x", "\\u00e9"]',
+        ],
+    )
+    def test_json_document_matches_safe_load(self, text):
+        with patch.object(yaml, "load") as yaml_load:
+            result = safe_load_yaml(text)
+        yaml_load.assert_not_called()
+        assert result == yaml.safe_load(text)
+
+    def test_surrogate_escape_goes_through_yaml(self):
+        with pytest.raises(yaml.YAMLError):
+            safe_load_yaml('{"a": "\\ud800"}')
+
+    @pytest.mark.parametrize(
+        "text", ['{\n\t"a": 1\n}', '{"a": "x\x7fy"}', '{"a": "x\x85y"}', '{"a": "x\x01y"}']
+    )
+    def test_characters_yaml_treats_differently_go_through_yaml(self, text):
+        try:
+            expected = yaml.load(text, Loader=yaml_loader._SafeLoader)
+        except yaml.YAMLError as exc:
+            expected = type(exc)
+
+        with patch.object(yaml, "load", wraps=yaml.load) as yaml_load:
+            try:
+                result = safe_load_yaml(text)
+            except yaml.YAMLError as exc:
+                result = type(exc)
+
+        yaml_load.assert_called_once()
+        assert result == expected
+
+    def test_yaml_flow_mapping_falls_back_to_yaml(self):
+        assert safe_load_yaml("{name: wf, flag: yes}") == {"name": "wf", "flag": True}
+
+
+def _write_settled(path, text, age_s=60):
+    """Write *text* and backdate its mtime past the loader's racy window."""
+    path.write_text(text)
+    settled_ns = time.time_ns() - age_s * 1_000_000_000
+    os.utime(path, ns=(settled_ns, settled_ns))
+
+
+class TestLoadYamlFile:
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        path = tmp_path / "workflow.yaml"
+        _write_settled(path, "name: wf\n")
+
+        with patch.object(yaml_loader, "safe_load_yaml", wraps=safe_load_yaml) as parse:
+            assert load_yaml_file(path) == {"name": "wf"}
+            assert load_yaml_file(path) == {"name": "wf"}
+
+        parse.assert_called_once()
+
+    def test_edited_file_is_reparsed(self, tmp_path):
+        path = tmp_path / "workflow.yaml"
+        _write_settled(path, "name: wf\n", age_s=60)
+        load_yaml_file(path)
+
+        _write_settled(path, "name: edited\n", age_s=30)
+
+        assert load_yaml_file(path) == {"name": "edited"}
+
+    def test_recent_same_size_edit_is_reparsed(self, tmp_path):
+        path = tmp_path / "workflow.yaml"
+        path.write_text("name: aa\n")
+        load_yaml_file(path)
+        mtime_ns = path.stat().st_mtime_ns
+
+        path.write_text("name: bb\n")
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+        assert load_yaml_file(path) == {"name": "bb"}
+
+    def test_relative_path_follows_working_directory(self, tmp_path, monkeypatch):
+        for name in ("one", "two"):
+            (tmp_path / name).mkdir()
+            _write_settled(tmp_path / name / "pyflow.yaml", f"name: {name}\n")
+
+        monkeypatch.chdir(tmp_path / "one")
+        assert load_yaml_file(Path("pyflow.yaml")) == {"name": "one"}
+        monkeypatch.chdir(tmp_path / "two")
+        assert load_yaml_file(Path("pyflow.yaml")) == {"name": "two"}
+
+    def test_callers_get_independent_copies(self, tmp_path):
+        path = tmp_path / "workflow.yaml"
+        path.write_text("agents:\n  - name: a\n")
+
+        load_yaml_file(path)["agents"][0]["name"] = "mutated"
+
+        assert load_yaml_file(path) == {"agents": [{"name": "a"}]}
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_yaml_file(tmp_path / "missing.yaml")
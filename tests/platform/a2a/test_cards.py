@@ -6,21 +6,23 @@ from pyflow.models.agent import AgentConfig
 from pyflow.models.workflow import A2AConfig, OrchestrationConfig, WorkflowDef
 from pyflow.platform.a2a.cards import AgentCardGenerator
 
+# Shared by every minimal workflow; the tests only read them.
+_AGENT1 = AgentConfig(
+    name="agent1",
+    type="llm",
+    model="gemini-2.5-flash",
+    instruction="Do something",
+)
+_ORCH = OrchestrationConfig(type="sequential", agents=["agent1"])
+
 
 def _minimal_workflow(name: str = "test_wf", *, a2a: A2AConfig | None = None) -> WorkflowDef:
     """Create a minimal valid workflow for testing."""
     return WorkflowDef(
         name=name,
         description=f"Description for {name}",
-        agents=[
-            AgentConfig(
-                name="agent1",
-                type="llm",
-                model="gemini-2.5-flash",
-                instruction="Do something",
-            ),
-        ],
-        orchestration=OrchestrationConfig(type="sequential", agents=["agent1"]),
+        agents=[_AGENT1],
+        orchestration=_ORCH,
         a2a=a2a,
     )
 
@@ -129,6 +131,13 @@ class TestCardStructure:
             assert skill.description
             assert isinstance(skill.tags, list)
 
+    def test_skills_shared_with_workflow(self) -> None:
+        """Frozen skills are reused by the card rather than copied."""
+        a2a = A2AConfig(skills=[SkillDef(id="s1", name="Skill One")])
+        card = AgentCardGenerator().generate_card(_minimal_workflow(a2a=a2a))
+
+        assert card.skills[0] is a2a.skills[0]
+
 
 class TestGenerateCards:
     """generate_cards() filters workflows by a2a presence (opt-in)."""
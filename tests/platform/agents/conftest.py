@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+from google.adk.agents.base_agent import BaseAgent
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.plugins.plugin_manager import PluginManager
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.sessions.session import Session
+
+# Stateless for these tests (no sessions stored, no plugins), so shared by every test.
+_SESSION_SERVICE = InMemorySessionService()
+_PLUGIN_MANAGER = PluginManager()
+
+
+@pytest.fixture
+def make_ctx() -> Callable[..., InvocationContext]:
+    """Return a factory for minimal InvocationContexts: ``make_ctx(agent, state=None)``."""
+
+    def make(agent: BaseAgent, state: dict | None = None) -> InvocationContext:
+        session = Session(
+            id="test-session",
+            app_name="test",
+            user_id="test-user",
+            state=state or {},
+            events=[],
+        )
+        return InvocationContext(
+            invocation_id="test-inv",
+            agent=agent,
+            session=session,
+            session_service=_SESSION_SERVICE,
+            agent_states={},
+            end_of_agents={},
+            plugin_manager=_PLUGIN_MANAGER,
+        )
+
+    return make
@@ -1,37 +1,12 @@
 from __future__ import annotations
 
 import json
+from unittest.mock import patch
 
 import pytest
 
-from google.adk.agents.invocation_context import InvocationContext
-from google.adk.plugins.plugin_manager import PluginManager
-from google.adk.sessions.in_memory_session_service import InMemorySessionService
-from google.adk.sessions.session import Session
-
 from pyflow.platform.agents.code_agent import CodeAgent, _import_function
 
-
-def _make_ctx(agent, state: dict | None = None) -> InvocationContext:
-    """Create a minimal InvocationContext for testing."""
-    session = Session(
-        id="test-session",
-        app_name="test",
-        user_id="test-user",
-        state=state or {},
-        events=[],
-    )
-    return InvocationContext(
-        invocation_id="test-inv",
-        agent=agent,
-        session=session,
-        session_service=InMemorySessionService(),
-        agent_states={},
-        end_of_agents={},
-        plugin_manager=PluginManager(),
-    )
-
-
 # ---------------------------------------------------------------------------
 # Test functions used by CodeAgent tests
 # ---------------------------------------------------------------------------
@@ -58,14 +33,14 @@ def _raises():
 
 
 class TestCodeAgentSync:
-    async def test_sync_function_reads_state_and_writes_output(self):
+    async def test_sync_function_reads_state_and_writes_output(self, make_ctx):
         agent = CodeAgent(
             name="adder",
             function_path="tests.platform.agents.test_code_agent._sync_add",
             input_keys=["a", "b"],
             output_key="sum",
         )
-        ctx = _make_ctx(agent, state={"a": 3, "b": 7})
+        ctx = make_ctx(agent, state={"a": 3, "b": 7})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert len(events) == 1
@@ -74,7 +49,7 @@ class TestCodeAgentSync:
         assert event.actions.state_delta == {"sum": 10}
         assert event.content.parts[0].text == "10"
 
-    async def test_missing_input_key_defaults_to_none(self):
+    async def test_missing_input_key_defaults_to_none(self, make_ctx):
         """Missing state keys resolve to None, which may cause the function to error."""
         agent = CodeAgent(
             name="adder",
@@ -82,7 +57,7 @@ class TestCodeAgentSync:
             input_keys=["a", "b"],
             output_key="sum",
         )
-        ctx = _make_ctx(agent, state={"a": 5})
+        ctx = make_ctx(agent, state={"a": 5})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert len(events) == 1
@@ -92,14 +67,14 @@ class TestCodeAgentSync:
 
 
 class TestCodeAgentAsync:
-    async def test_async_function_called_correctly(self):
+    async def test_async_function_called_correctly(self, make_ctx):
         agent = CodeAgent(
             name="multiplier",
             function_path="tests.platform.agents.test_code_agent._async_multiply",
             input_keys=["x", "y"],
             output_key="product",
         )
-        ctx = _make_ctx(agent, state={"x": 4, "y": 5})
+        ctx = make_ctx(agent, state={"x": 4, "y": 5})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert len(events) == 1
@@ -107,14 +82,14 @@ class TestCodeAgentAsync:
 
 
 class TestCodeAgentNoArgs:
-    async def test_empty_input_keys(self):
+    async def test_empty_input_keys(self, make_ctx):
         agent = CodeAgent(
             name="checker",
             function_path="tests.platform.agents.test_code_agent._no_args",
             input_keys=[],
             output_key="status",
         )
-        ctx = _make_ctx(agent)
+        ctx = make_ctx(agent)
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert len(events) == 1
@@ -125,7 +100,7 @@ class TestCodeAgentNoArgs:
 
 
 class TestCodeAgentStringResult:
-    async def test_string_result_not_double_serialized(self):
+    async def test_string_result_not_double_serialized(self, make_ctx):
         """String results should appear as-is, not JSON-quoted."""
         agent = CodeAgent(
             name="greeter",
@@ -133,7 +108,7 @@ class TestCodeAgentStringResult:
             input_keys=[],
             output_key="greeting",
         )
-        ctx = _make_ctx(agent)
+        ctx = make_ctx(agent)
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert len(events) == 1
@@ -142,14 +117,14 @@ class TestCodeAgentStringResult:
 
 
 class TestCodeAgentErrorHandling:
-    async def test_exception_yields_error_event(self):
+    async def test_exception_yields_error_event(self, make_ctx):
         agent = CodeAgent(
             name="bad",
             function_path="tests.platform.agents.test_code_agent._raises",
             input_keys=[],
             output_key="result",
         )
-        ctx = _make_ctx(agent)
+        ctx = make_ctx(agent)
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert len(events) == 1
@@ -158,19 +133,49 @@ class TestCodeAgentErrorHandling:
         assert "boom" in event.content.parts[0].text
         assert event.actions.state_delta == {}
 
-    async def test_bad_function_path_yields_error(self):
+    async def test_bad_function_path_yields_error(self, make_ctx):
         agent = CodeAgent(
             name="bad",
             function_path="nonexistent.module.func",
             input_keys=[],
             output_key="result",
         )
-        ctx = _make_ctx(agent)
+        ctx = make_ctx(agent)
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert len(events) == 1
         assert "CodeAgent error" in events[0].content.parts[0].text
 
+    async def test_failed_import_not_cached(self, make_ctx):
+        agent = CodeAgent(
+            name="bad",
+            function_path="nonexistent.module.func",
+            input_keys=[],
+            output_key="result",
+        )
+        for _ in range(2):
+            events = [e async for e in agent._run_async_impl(make_ctx(agent))]
+            assert "CodeAgent error" in events[0].content.parts[0].text
+
+
+class TestCodeAgentFunctionCache:
+    async def test_function_imported_once(self, make_ctx):
+        agent = CodeAgent(
+            name="adder",
+            function_path="tests.platform.agents.test_code_agent._sync_add",
+            input_keys=["a", "b"],
+            output_key="sum",
+        )
+        with patch(
+            "pyflow.platform.agents.code_agent._import_function", wraps=_import_function
+        ) as import_:
+            for a in (1, 2, 3):
+                ctx = make_ctx(agent, state={"a": a, "b": 10})
+                events = [e async for e in agent._run_async_impl(ctx)]
+                assert events[0].actions.state_delta == {"sum": a + 10}
+
+        import_.assert_called_once_with("tests.platform.agents.test_code_agent._sync_add")
+
 
 class TestImportFunction:
     def test_valid_import(self):
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import sys
+from dataclasses import FrozenInstanceError
+
+import pytest
 from google.adk.agents.base_agent import BaseAgent
 from google.adk.agents.invocation_context import InvocationContext
 from google.adk.events.event import Event
+from google.adk.plugins.plugin_manager import PluginManager
+from google.adk.sessions.in_memory_session_service import InMemorySessionService
+from google.adk.sessions.session import Session
 from typing import AsyncGenerator
 
-from pyflow.platform.agents.dag_agent import DagAgent, DagNodeRuntime
+from pyflow.platform.agents.dag_agent import DagAgent, DagNodeRuntime, _topological_waves
 
 
 class StubAgent(BaseAgent):
@@ -21,6 +28,24 @@ def _make_stub_agent(name: str) -> StubAgent:
     return StubAgent(name=name)
 
 
+class RecordingAgent(BaseAgent):
+    """Agent that yields one event tagged with its name."""
+
+    async def _run_async_impl(self, ctx: InvocationContext) -> AsyncGenerator[Event, None]:
+        yield Event(author=self.name, invocation_id=ctx.invocation_id)
+
+
+def _make_ctx(agent: BaseAgent) -> InvocationContext:
+    session = Session(id="test-session", app_name="test", user_id="test-user", events=[])
+    return InvocationContext(
+        invocation_id="test-inv",
+        agent=agent,
+        session=session,
+        session_service=InMemorySessionService(),
+        plugin_manager=PluginManager(),
+    )
+
+
 class TestDagValidation:
     def test_valid_linear_dag(self):
         a = _make_stub_agent("a")
@@ -48,3 +73,68 @@ class TestDagValidation:
         nodes = [DagNodeRuntime(name="a", agent=a, depends_on=set())]
         dag = DagAgent(name="test", dag_nodes=nodes, sub_agents=[a])
         assert len(dag.dag_nodes) == 1
+
+    def test_node_is_immutable(self):
+        node = DagNodeRuntime(name="a", agent=_make_stub_agent("a"))
+        assert node.depends_on == frozenset()
+        with pytest.raises(FrozenInstanceError):
+            node.depends_on = frozenset({"b"})
+
+    def test_set_depends_on_stored_as_frozenset(self):
+        deps = {"b", "c"}
+        node = DagNodeRuntime(name="a", agent=_make_stub_agent("a"), depends_on=deps)
+        assert isinstance(node.depends_on, frozenset)
+        assert node.depends_on == frozenset({"b", "c"})
+
+    def test_depends_on_coerced_to_interned_frozenset(self):
+        # Built at run time, so not the interned "upstream" literal
+        prefix = "up"
+        dep = f"{prefix}stream"
+        node = DagNodeRuntime(name="a", agent=_make_stub_agent("a"), depends_on=[dep])
+        assert node.depends_on == frozenset({"upstream"})
+        assert isinstance(node.depends_on, frozenset)
+        assert next(iter(node.depends_on)) is sys.intern("upstream")
+
+
+class TestDagWaves:
+    def test_diamond_waves(self):
+        agents = {n: _make_stub_agent(n) for n in "abcd"}
+        nodes = [
+            DagNodeRuntime(name="d", agent=agents["d"], depends_on=frozenset({"b", "c"})),
+            DagNodeRuntime(name="c", agent=agents["c"], depends_on=frozenset({"a"})),
+            DagNodeRuntime(name="b", agent=agents["b"], depends_on=frozenset({"a"})),
+            DagNodeRuntime(name="a", agent=agents["a"]),
+        ]
+        waves = [[node.name for node in wave] for wave in _topological_waves(nodes)]
+        assert waves == [["a"], ["c", "b"], ["d"]]
+
+    def test_cycle_rejected_at_construction(self):
+        a, b = _make_stub_agent("a"), _make_stub_agent("b")
+        nodes = [
+            DagNodeRuntime(name="a", agent=a, depends_on=frozenset({"b"})),
+            DagNodeRuntime(name="b", agent=b, depends_on=frozenset({"a"})),
+        ]
+        with pytest.raises(ValueError, match="DAG deadlock"):
+            DagAgent(name="cyclic", dag_nodes=nodes, sub_agents=[a, b])
+
+    def test_unknown_dependency_rejected_at_construction(self):
+        a = _make_stub_agent("a")
+        nodes = [DagNodeRuntime(name="a", agent=a, depends_on=frozenset({"missing"}))]
+        with pytest.raises(ValueError, match=r"\['a'\]"):
+            DagAgent(name="broken", dag_nodes=nodes, sub_agents=[a])
+
+
+class TestDagExecution:
+    async def test_runs_waves_in_dependency_order(self):
+        agents = {n: RecordingAgent(name=n) for n in "abcd"}
+        nodes = [
+            DagNodeRuntime(name="a", agent=agents["a"]),
+            DagNodeRuntime(name="b", agent=agents["b"], depends_on=frozenset({"a"})),
+            DagNodeRuntime(name="c", agent=agents["c"], depends_on=frozenset({"a"})),
+            DagNodeRuntime(name="d", agent=agents["d"], depends_on=frozenset({"b", "c"})),
+        ]
+        dag = DagAgent(name="diamond", dag_nodes=nodes, sub_agents=list(agents.values()))
+
+        events = [e async for e in dag._run_async_impl(_make_ctx(dag))]
+
+        assert [e.author for e in events] == ["a", "b", "c", "d"]
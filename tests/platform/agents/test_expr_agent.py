@@ -1,34 +1,12 @@
 from __future__ import annotations
 
-import pytest
+from types import CodeType
+from unittest.mock import patch
 
-from google.adk.agents.invocation_context import InvocationContext
-from google.adk.plugins.plugin_manager import PluginManager
-from google.adk.sessions.in_memory_session_service import InMemorySessionService
-from google.adk.sessions.session import Session
+import pytest
 
 from pyflow.platform.agents.expr_agent import ExprAgent
-
-
-def _make_ctx(agent, state: dict | None = None) -> InvocationContext:
-    """Create a minimal InvocationContext for testing."""
-    session = Session(
-        id="test-session",
-        app_name="test",
-        user_id="test-user",
-        state=state or {},
-        events=[],
-    )
-    return InvocationContext(
-        invocation_id="test-inv",
-        agent=agent,
-        session=session,
-        session_service=InMemorySessionService(),
-        agent_states={},
-        end_of_agents={},
-        plugin_manager=PluginManager(),
-    )
-
+from pyflow.tools.condition import _SAFE_BUILTINS
 
 # ---------------------------------------------------------------------------
 # Arithmetic expressions
@@ -36,40 +14,40 @@ def _make_ctx(agent, state: dict | None = None) -> InvocationContext:
 
 
 class TestExprAgentArithmetic:
-    async def test_simple_addition(self):
+    async def test_simple_addition(self, make_ctx):
         agent = ExprAgent(
             name="calc",
             expression="a + b",
             input_keys=["a", "b"],
             output_key="result",
         )
-        ctx = _make_ctx(agent, state={"a": 3, "b": 7})
+        ctx = make_ctx(agent, state={"a": 3, "b": 7})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert len(events) == 1
         assert events[0].actions.state_delta == {"result": 10}
         assert events[0].content.parts[0].text == "10"
 
-    async def test_margin_calculation(self):
+    async def test_margin_calculation(self, make_ctx):
         agent = ExprAgent(
             name="margin",
             expression="round((price - cost) / price * 100, 2)",
             input_keys=["price", "cost"],
             output_key="margin_pct",
         )
-        ctx = _make_ctx(agent, state={"price": 100.0, "cost": 65.0})
+        ctx = make_ctx(agent, state={"price": 100.0, "cost": 65.0})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert events[0].actions.state_delta == {"margin_pct": 35.0}
 
-    async def test_expression_with_builtins(self):
+    async def test_expression_with_builtins(self, make_ctx):
         agent = ExprAgent(
             name="aggregator",
             expression="sum(values)",
             input_keys=["values"],
             output_key="total",
         )
-        ctx = _make_ctx(agent, state={"values": [10, 20, 30]})
+        ctx = make_ctx(agent, state={"values": [10, 20, 30]})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert events[0].actions.state_delta == {"total": 60}
@@ -81,14 +59,14 @@ class TestExprAgentArithmetic:
 
 
 class TestExprAgentStringResult:
-    async def test_string_result_not_double_serialized(self):
+    async def test_string_result_not_double_serialized(self, make_ctx):
         agent = ExprAgent(
             name="fmt",
             expression="str(count) + ' items'",
             input_keys=["count"],
             output_key="label",
         )
-        ctx = _make_ctx(agent, state={"count": 5})
+        ctx = make_ctx(agent, state={"count": 5})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert events[0].actions.state_delta == {"label": "5 items"}
@@ -101,14 +79,14 @@ class TestExprAgentStringResult:
 
 
 class TestExprAgentNoInputKeys:
-    async def test_constant_expression(self):
+    async def test_constant_expression(self, make_ctx):
         agent = ExprAgent(
             name="const",
             expression="42",
             input_keys=[],
             output_key="answer",
         )
-        ctx = _make_ctx(agent)
+        ctx = make_ctx(agent)
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert events[0].actions.state_delta == {"answer": 42}
@@ -120,14 +98,14 @@ class TestExprAgentNoInputKeys:
 
 
 class TestExprAgentBoolean:
-    async def test_comparison_returns_bool(self):
+    async def test_comparison_returns_bool(self, make_ctx):
         agent = ExprAgent(
             name="check",
             expression="score > threshold",
             input_keys=["score", "threshold"],
             output_key="passed",
         )
-        ctx = _make_ctx(agent, state={"score": 85, "threshold": 70})
+        ctx = make_ctx(agent, state={"score": 85, "threshold": 70})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert events[0].actions.state_delta == {"passed": True}
@@ -139,26 +117,26 @@ class TestExprAgentBoolean:
 
 
 class TestExprAgentComplex:
-    async def test_list_comprehension(self):
+    async def test_list_comprehension(self, make_ctx):
         agent = ExprAgent(
             name="doubler",
             expression="[x * 2 for x in items]",
             input_keys=["items"],
             output_key="doubled",
         )
-        ctx = _make_ctx(agent, state={"items": [1, 2, 3]})
+        ctx = make_ctx(agent, state={"items": [1, 2, 3]})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert events[0].actions.state_delta == {"doubled": [2, 4, 6]}
 
-    async def test_dict_expression(self):
+    async def test_dict_expression(self, make_ctx):
         agent = ExprAgent(
             name="builder",
             expression="{'total': a + b, 'avg': (a + b) / 2}",
             input_keys=["a", "b"],
             output_key="stats",
         )
-        ctx = _make_ctx(agent, state={"a": 10, "b": 20})
+        ctx = make_ctx(agent, state={"a": 10, "b": 20})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert events[0].actions.state_delta == {"stats": {"total": 30, "avg": 15.0}}
@@ -170,35 +148,35 @@ class TestExprAgentComplex:
 
 
 class TestExprAgentErrors:
-    async def test_runtime_error_yields_error_event(self):
+    async def test_runtime_error_yields_error_event(self, make_ctx):
         agent = ExprAgent(
             name="bad",
             expression="a / b",
             input_keys=["a", "b"],
             output_key="result",
         )
-        ctx = _make_ctx(agent, state={"a": 1, "b": 0})
+        ctx = make_ctx(agent, state={"a": 1, "b": 0})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert len(events) == 1
         assert "ExprAgent error" in events[0].content.parts[0].text
         assert events[0].actions.state_delta == {}
 
-    async def test_missing_variable_yields_error(self):
+    async def test_missing_variable_yields_error(self, make_ctx):
         agent = ExprAgent(
             name="bad",
             expression="x + y",
             input_keys=["x"],
             output_key="result",
         )
-        ctx = _make_ctx(agent, state={"x": 5})
+        ctx = make_ctx(agent, state={"x": 5})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert len(events) == 1
         assert "ExprAgent error" in events[0].content.parts[0].text
         assert events[0].actions.state_delta == {}
 
-    async def test_event_metadata(self):
+    async def test_event_metadata(self, make_ctx):
         """Verify author and invocation_id are set correctly."""
         agent = ExprAgent(
             name="meta_test",
@@ -206,7 +184,7 @@ class TestExprAgentErrors:
             input_keys=[],
             output_key="result",
         )
-        ctx = _make_ctx(agent)
+        ctx = make_ctx(agent)
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert events[0].author == "meta_test"
@@ -254,3 +232,135 @@ class TestExprAgentASTValidation:
             output_key="result",
         )
         assert agent.expression == "max(a, b) + min(c, d)"
+
+    async def test_runs_cached_code_object(self, make_ctx):
+        agent = ExprAgent(
+            name="calc",
+            expression="a * 2",
+            input_keys=["a"],
+            output_key="result",
+        )
+        with patch("pyflow.platform.agents.expr_agent.eval", create=True, wraps=eval) as eval_:
+            for value in (1, 2):
+                ctx = make_ctx(agent, state={"a": value})
+                events = [e async for e in agent._run_async_impl(ctx)]
+                assert events[0].actions.state_delta == {"result": value * 2}
+
+        assert eval_.call_count == 2
+        assert all(call.args[0] is agent._code for call in eval_.call_args_list)
+        assert isinstance(agent._code, CodeType)
+
+
+# ---------------------------------------------------------------------------
+# Constant folding
+# ---------------------------------------------------------------------------
+
+
+class TestExprAgentConstantFolding:
+    async def test_constant_evaluated_once_at_construction(self, make_ctx):
+        agent = ExprAgent(
+            name="const",
+            expression="6 * 7",
+            input_keys=[],
+            output_key="answer",
+        )
+        with patch("pyflow.platform.agents.expr_agent.eval", create=True, wraps=eval) as eval_:
+            for _ in range(2):
+                events = [e async for e in agent._run_async_impl(make_ctx(agent))]
+                assert events[0].actions.state_delta == {"answer": 42}
+                assert events[0].content.parts[0].text == "42"
+
+        eval_.assert_not_called()
+
+    async def test_expression_with_names_not_folded(self, make_ctx):
+        agent = ExprAgent(
+            name="calc",
+            expression="abs(-3)",
+            input_keys=[],
+            output_key="result",
+        )
+        ctx = make_ctx(agent)
+
+        with patch("pyflow.platform.agents.expr_agent.eval", create=True, wraps=eval) as eval_:
+            events = [e async for e in agent._run_async_impl(ctx)]
+
+        assert events[0].actions.state_delta == {"result": 3}
+        eval_.assert_called_once()
+
+    async def test_name_inside_comprehension_not_folded(self, make_ctx):
+        agent = ExprAgent(
+            name="calc",
+            expression="[x for _ in (1,)][0]",
+            input_keys=["x"],
+            output_key="result",
+        )
+        ctx = make_ctx(agent, state={"x": 7})
+
+        events = [e async for e in agent._run_async_impl(ctx)]
+
+        assert events[0].actions.state_delta == {"result": 7}
+
+    async def test_mutable_constant_is_fresh_per_run(self, make_ctx):
+        agent = ExprAgent(
+            name="lit",
+            expression="{'a': 1}",
+            input_keys=[],
+            output_key="result",
+        )
+
+        first = [e async for e in agent._run_async_impl(make_ctx(agent))]
+        second = [e async for e in agent._run_async_impl(make_ctx(agent))]
+
+        assert first[0].actions.state_delta == second[0].actions.state_delta == {"result": {"a": 1}}
+        assert first[0].actions.state_delta["result"] is not second[0].actions.state_delta["result"]
+
+    @pytest.mark.parametrize("expression", ["1 / 0", "(1,)[5]", "'a' + 1", "'a'.missing"])
+    async def test_failing_constant_errors_at_run_time(self, expression, make_ctx):
+        with pytest.raises((ArithmeticError, LookupError, TypeError, AttributeError)) as raised:
+            eval(expression, {"__builtins__": _SAFE_BUILTINS})
+        agent = ExprAgent(
+            name="failing",
+            expression=expression,
+            input_keys=[],
+            output_key="result",
+        )
+        events = [e async for e in agent._run_async_impl(make_ctx(agent))]
+
+        assert events[0].content.parts[0].text == f"ExprAgent error: {raised.value}"
+        assert events[0].actions.state_delta == {}
+
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "9 ** 9 ** 9",
+            "'a' * 10 ** 12",
+            "1 << 10 ** 9",
+            "'%0299999999d' % 1",
+            "[0 for a in 'x' * 1000 for b in 'x' * 1000 for c in 'x' * 1000]",
+            "{'a': 1}",
+        ],
+    )
+    def test_costly_constant_not_folded(self, expression):
+        with patch("pyflow.platform.agents.expr_agent.eval", create=True, wraps=eval) as eval_:
+            agent = ExprAgent(
+                name="costly",
+                expression=expression,
+                input_keys=[],
+                output_key="result",
+            )
+
+        eval_.assert_not_called()
+        assert agent._is_const is False
+
+    def test_memory_error_while_folding_leaves_agent_unfolded(self):
+        with patch(
+            "pyflow.platform.agents.expr_agent.eval", create=True, side_effect=MemoryError
+        ):
+            agent = ExprAgent(
+                name="huge",
+                expression="'a' * 3",
+                input_keys=[],
+                output_key="result",
+            )
+
+        assert agent._is_const is False
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
+import copy
 from typing import Any
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
-from google.adk.agents.invocation_context import InvocationContext
-from google.adk.plugins.plugin_manager import PluginManager
-from google.adk.sessions.in_memory_session_service import InMemorySessionService
-from google.adk.sessions.session import Session
+import pytest
 from google.adk.tools.tool_context import ToolContext
 
 from pyflow.platform.agents.tool_agent import ToolAgent, _resolve_templates
@@ -35,33 +33,13 @@ def _make_stub_tool(side_effect=None) -> BasePlatformTool:
     return tool
 
 
-def _make_ctx(agent, state: dict | None = None) -> InvocationContext:
-    """Create a minimal InvocationContext for testing."""
-    session = Session(
-        id="test-session",
-        app_name="test",
-        user_id="test-user",
-        state=state or {},
-        events=[],
-    )
-    return InvocationContext(
-        invocation_id="test-inv",
-        agent=agent,
-        session=session,
-        session_service=InMemorySessionService(),
-        agent_states={},
-        end_of_agents={},
-        plugin_manager=PluginManager(),
-    )
-
-
 # ---------------------------------------------------------------------------
 # ToolAgent execution tests
 # ---------------------------------------------------------------------------
 
 
 class TestToolAgentExecution:
-    async def test_executes_tool_and_writes_state(self):
+    async def test_executes_tool_and_writes_state(self, make_ctx):
         tool = _make_stub_tool()
         agent = ToolAgent(
             name="fetcher",
@@ -69,7 +47,7 @@ class TestToolAgentExecution:
             fixed_config={"url": "https://example.com", "method": "GET"},
             output_key="response",
         )
-        ctx = _make_ctx(agent)
+        ctx = make_ctx(agent)
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert len(events) == 1
@@ -78,7 +56,7 @@ class TestToolAgentExecution:
         result = event.actions.state_delta["response"]
         assert result == {"echo": {"url": "https://example.com", "method": "GET"}}
 
-    async def test_template_resolution_from_state(self):
+    async def test_template_resolution_from_state(self, make_ctx):
         tool = _make_stub_tool()
         agent = ToolAgent(
             name="fetcher",
@@ -86,13 +64,13 @@ class TestToolAgentExecution:
             fixed_config={"url": "https://api.com/{endpoint}", "method": "GET"},
             output_key="data",
         )
-        ctx = _make_ctx(agent, state={"endpoint": "users"})
+        ctx = make_ctx(agent, state={"endpoint": "users"})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         result = events[0].actions.state_delta["data"]
         assert result == {"echo": {"url": "https://api.com/users", "method": "GET"}}
 
-    async def test_full_template_preserves_type(self):
+    async def test_full_template_preserves_type(self, make_ctx):
         """A value that is exactly ``{key}`` should return the raw state value."""
         tool = _make_stub_tool()
         agent = ToolAgent(
@@ -102,13 +80,32 @@ class TestToolAgentExecution:
             output_key="result",
         )
         state_data = {"key": "value", "count": 42}
-        ctx = _make_ctx(agent, state={"input_data": state_data})
+        ctx = make_ctx(agent, state={"input_data": state_data})
         events = [e async for e in agent._run_async_impl(ctx)]
 
         result = events[0].actions.state_delta["result"]
         assert result["echo"]["data"] == state_data
 
-    async def test_empty_config(self):
+    async def test_templates_compiled_once_at_construction(self, make_ctx):
+        tool = _make_stub_tool()
+        agent = ToolAgent(
+            name="fetcher",
+            tool_instance=tool,
+            fixed_config={"url": "https://api.com/{endpoint}", "params": {"q": "{query}"}},
+            output_key="data",
+        )
+        with patch("pyflow.platform.agents.tool_agent._compile_templates") as compile_:
+            for endpoint in ("users", "orders"):
+                ctx = make_ctx(agent, state={"endpoint": endpoint, "query": "x"})
+                events = [e async for e in agent._run_async_impl(ctx)]
+                result = events[0].actions.state_delta["data"]
+                assert result == {
+                    "echo": {"url": f"https://api.com/{endpoint}", "params": {"q": "x"}}
+                }
+
+        compile_.assert_not_called()
+
+    async def test_empty_config(self, make_ctx):
         tool = _make_stub_tool()
         agent = ToolAgent(
             name="simple",
@@ -116,14 +113,51 @@ class TestToolAgentExecution:
             fixed_config={},
             output_key="out",
         )
-        ctx = _make_ctx(agent)
+        ctx = make_ctx(agent)
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert events[0].actions.state_delta["out"] == {"echo": {}}
 
 
+class TestToolAgentConfigIsolation:
+    @pytest.mark.parametrize(
+        ("fixed_config", "state"),
+        [
+            ({"tags": ["a"], "headers": {"Accept": "json"}}, {}),
+            ({"tags": ["a"], "headers": {"Accept": "json"}}, {"env": "prod"}),
+            ({"url": "{host}", "tags": ["a"], "headers": {"Accept": "json"}}, {"host": "h"}),
+        ],
+        ids=["template-free-empty-state", "template-free-with-state", "partly-templated"],
+    )
+    async def test_tool_mutating_kwargs_does_not_change_config(
+        self, fixed_config, state, make_ctx
+    ):
+        seen: list[dict] = []
+
+        async def mutate(tool_context, **kwargs):
+            seen.append(copy.deepcopy(kwargs))
+            kwargs["tags"].append("mutated")
+            kwargs["headers"]["Accept"] = "mutated"
+            return {}
+
+        original = copy.deepcopy(fixed_config)
+        agent = ToolAgent(
+            name="mutator",
+            tool_instance=_make_stub_tool(side_effect=mutate),
+            fixed_config=fixed_config,
+            output_key="out",
+        )
+
+        for _ in range(2):
+            [e async for e in agent._run_async_impl(make_ctx(agent, state=state))]
+
+        assert agent.fixed_config == original
+        assert seen[1]["tags"] == ["a"]
+        assert seen[1]["headers"] == {"Accept": "json"}
+
+
 class TestToolAgentErrorHandling:
-    async def test_tool_exception_yields_error_event(self):
+    async def test_tool_exception_yields_error_event(self, make_ctx):
         tool = _make_stub_tool(side_effect=RuntimeError("connection failed"))
         agent = ToolAgent(
             name="broken",
@@ -131,7 +165,7 @@ class TestToolAgentErrorHandling:
             fixed_config={"url": "https://example.com"},
             output_key="data",
         )
-        ctx = _make_ctx(agent)
+        ctx = make_ctx(agent)
         events = [e async for e in agent._run_async_impl(ctx)]
 
         assert len(events) == 1
@@ -184,6 +218,18 @@ class TestResolveTemplates:
         result = _resolve_templates({"url": "{missing}"}, {})
         assert result["url"] == "{missing}"
 
+    def test_partial_match_with_some_keys_missing(self):
+        result = _resolve_templates({"path": "{base}/{missing}"}, {"base": "api"})
+        assert result["path"] == "api/{missing}"
+
+    def test_partial_match_keeps_literal_braces(self):
+        result = _resolve_templates({"body": '{"id": "{id}"} }{'}, {"id": 7})
+        assert result["body"] == '{"id": "7"} }{'
+
+    def test_partial_match_with_numeric_key(self):
+        result = _resolve_templates({"path": "/items/{0}/{name}"}, {"0": "first", "name": "x"})
+        assert result["path"] == "/items/first/x"
+
     def test_non_string_values_pass_through(self):
         config = {"count": 42, "enabled": True, "data": None}
         result = _resolve_templates(config, {})
@@ -194,3 +240,30 @@ class TestResolveTemplates:
         original = {"url": "{host}/api"}
         _resolve_templates(config, {"host": "localhost"})
         assert config == original
+
+    def test_nested_containers_are_rebuilt(self):
+        config = {"headers": {"X-Env": "{env}"}, "tags": ["static"]}
+        result = _resolve_templates(config, {"env": "prod"})
+
+        assert result == {"headers": {"X-Env": "prod"}, "tags": ["static"]}
+        assert result is not config
+        assert result["headers"] is not config["headers"]
+        # Subtrees without templates are copied too, so callers may mutate the result
+        assert result["tags"] is not config["tags"]
+
+        result["headers"]["X-Env"] = "mutated"
+        result["tags"].append("mutated")
+        assert config == {"headers": {"X-Env": "{env}"}, "tags": ["static"]}
+
+    def test_empty_state_keeps_placeholders_in_a_copy(self):
+        config = {"url": "{host}/api", "data": "{payload}", "tags": ["{env}"]}
+        result = _resolve_templates(config, {})
+        assert result == config
+        assert result["tags"] is not config["tags"]
+
+    def test_config_without_templates_resolves_to_copy(self):
+        config = {"url": "https://example.com", "headers": {"Accept": "text/plain"}}
+        result = _resolve_templates(config, {"url": "ignored"})
+        assert result == config
+        assert result is not config
+        assert result["headers"] is not config["headers"]
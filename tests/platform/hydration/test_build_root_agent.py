@@ -7,11 +7,7 @@ import pytest
 
 from pyflow.platform.hydration.hydrator import build_root_agent
 
-
-class TestBuildRootAgent:
-    def test_builds_agent_from_workflow_yaml(self, tmp_path: Path) -> None:
-        """build_root_agent() hydrates workflow.yaml next to the caller file."""
-        yaml_content = """\
+_WORKFLOW_YAML = """\
 name: test_factory
 description: "Factory test workflow"
 agents:
@@ -24,7 +20,12 @@ orchestration:
   type: sequential
   agents: [main]
 """
-        (tmp_path / "workflow.yaml").write_text(yaml_content)
+
+
+class TestBuildRootAgent:
+    def test_builds_agent_from_workflow_yaml(self, tmp_path: Path) -> None:
+        """build_root_agent() hydrates workflow.yaml next to the caller file."""
+        (tmp_path / "workflow.yaml").write_text(_WORKFLOW_YAML)
         fake_caller = tmp_path / "agent.py"
         fake_caller.touch()
 
@@ -39,3 +40,28 @@ orchestration:
 
         with pytest.raises(FileNotFoundError):
             build_root_agent(str(fake_caller))
+
+    def test_repeat_call_returns_fresh_agent(self, tmp_path: Path) -> None:
+        """Each call hydrates a new agent tree, so none is shared across callers."""
+        (tmp_path / "workflow.yaml").write_text(_WORKFLOW_YAML)
+        fake_caller = tmp_path / "agent.py"
+        fake_caller.touch()
+
+        first = build_root_agent(str(fake_caller))
+        second = build_root_agent(str(fake_caller))
+
+        assert second is not first
+        assert second.sub_agents[0] is not first.sub_agents[0]
+
+    def test_edited_yaml_is_picked_up(self, tmp_path: Path) -> None:
+        """Changing workflow.yaml is reflected in the next agent built."""
+        workflow_yaml = tmp_path / "workflow.yaml"
+        workflow_yaml.write_text(_WORKFLOW_YAML)
+        fake_caller = tmp_path / "agent.py"
+        fake_caller.touch()
+
+        build_root_agent(str(fake_caller))
+        workflow_yaml.write_text(_WORKFLOW_YAML.replace("test_factory", "edited_factory"))
+        second = build_root_agent(str(fake_caller))
+
+        assert second.name == "edited_factory"
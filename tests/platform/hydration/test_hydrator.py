@@ -1,14 +1,29 @@
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import json
+from collections.abc import Iterator
+from unittest.mock import MagicMock
 
 import pytest
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.agents.loop_agent import LoopAgent
+from google.adk.agents.parallel_agent import ParallelAgent
+from google.adk.agents.sequential_agent import SequentialAgent
+from google.adk.models.base_llm import BaseLlm
+from google.adk.tools.agent_tool import AgentTool
+from pydantic import BaseModel
 
 from pyflow.models.agent import AgentConfig
 from pyflow.models.workflow import DagNode as DagNodeConfig
 from pyflow.models.workflow import OrchestrationConfig, WorkflowDef
+from pyflow.platform.agents.code_agent import CodeAgent
+from pyflow.platform.agents.dag_agent import DagAgent
+from pyflow.platform.agents.expr_agent import ExprAgent
+from pyflow.platform.agents.tool_agent import ToolAgent
+from pyflow.platform.hydration import hydrator as hydrator_module
 from pyflow.platform.hydration.hydrator import WorkflowHydrator
 from pyflow.platform.registry.tool_registry import ToolRegistry
+from pyflow.tools.base import BasePlatformTool
 
 
 def _make_llm_agent_config(
@@ -47,13 +62,46 @@ def _make_workflow(
     )
 
 
+@pytest.fixture(scope="module")
+def _shared_tool_registry() -> ToolRegistry:
+    # spec= introspects ToolRegistry on every construction; build it once per module.
+    return MagicMock(spec=ToolRegistry)
+
+
 @pytest.fixture
-def mock_tool_registry() -> ToolRegistry:
-    registry = MagicMock(spec=ToolRegistry)
+def mock_tool_registry(_shared_tool_registry) -> ToolRegistry:
+    registry = _shared_tool_registry
+    # Clear calls plus any return_value/side_effect a previous test configured
+    registry.reset_mock(return_value=True, side_effect=True)
     registry.resolve_tools.return_value = [MagicMock(name="mock_function_tool")]
     return registry
 
 
+@pytest.fixture
+def mock_litellm_cls(monkeypatch: pytest.MonkeyPatch) -> Iterator[MagicMock]:
+    """Stand-in for the lazily imported LiteLlm class; instances are BaseLlm mocks."""
+    litellm_cls = MagicMock(return_value=MagicMock(spec=BaseLlm))
+    monkeypatch.setattr(hydrator_module, "_get_litellm", lambda: litellm_cls)
+    hydrator_module._make_litellm_model.cache_clear()
+    yield litellm_cls
+    hydrator_module._make_litellm_model.cache_clear()
+
+
+@pytest.fixture
+def mock_planners(monkeypatch: pytest.MonkeyPatch) -> dict[str, MagicMock]:
+    """Replace both ADK planner classes; returns them keyed by planner name.
+
+    Planner instances are only identity-checked, so the classes return sentinels.
+    """
+    planners = {
+        "plan_react": MagicMock(return_value=object()),
+        "builtin": MagicMock(return_value=object()),
+    }
+    monkeypatch.setattr(hydrator_module, "PlanReActPlanner", planners["plan_react"])
+    monkeypatch.setattr(hydrator_module, "BuiltInPlanner", planners["builtin"])
+    return planners
+
+
 # ---------------------------------------------------------------------------
 # Existing tests: sequential, parallel, loop, tools, litellm, output_key
 # ---------------------------------------------------------------------------
@@ -62,9 +110,6 @@ def mock_tool_registry() -> ToolRegistry:
 class TestHydrateSingleLlmAgentSequential:
     def test_returns_sequential_agent_wrapping_llm_agent(self, mock_tool_registry):
         """Single LLM agent in sequential orchestration -> SequentialAgent wrapping LlmAgent."""
-        from google.adk.agents.llm_agent import LlmAgent
-        from google.adk.agents.sequential_agent import SequentialAgent
-
         workflow = _make_workflow()
         hydrator = WorkflowHydrator(mock_tool_registry)
         root = hydrator.hydrate(workflow)
@@ -79,8 +124,6 @@ class TestHydrateSingleLlmAgentSequential:
 class TestHydrateMultiAgentSequential:
     def test_two_llm_agents_in_sequential(self, mock_tool_registry):
         """Two LLM agents in sequential -> SequentialAgent with 2 sub_agents."""
-        from google.adk.agents.sequential_agent import SequentialAgent
-
         agents = [
             _make_llm_agent_config(name="fetcher", instruction="Fetch data"),
             _make_llm_agent_config(name="analyzer", instruction="Analyze data"),
@@ -95,36 +138,30 @@ class TestHydrateMultiAgentSequential:
         assert root.sub_agents[1].name == "analyzer"
 
 
-class TestHydrateParallelOrchestration:
-    def test_two_agents_in_parallel(self, mock_tool_registry):
-        """Two agents in parallel -> ParallelAgent."""
-        from google.adk.agents.parallel_agent import ParallelAgent
-
+class TestHydrateWrapperOrchestration:
+    @pytest.mark.parametrize(
+        ("orch_type", "expected_cls", "n_agents"),
+        [
+            ("sequential", SequentialAgent, 2),
+            ("parallel", ParallelAgent, 2),
+            ("loop", LoopAgent, 1),
+        ],
+    )
+    def test_agents_wrapped_by_orchestration_type(
+        self, mock_tool_registry, orch_type, expected_cls, n_agents
+    ):
+        """Each orchestration type -> its ADK wrapper agent around every sub-agent."""
         agents = [
-            _make_llm_agent_config(name="worker_a", instruction="Task A"),
-            _make_llm_agent_config(name="worker_b", instruction="Task B"),
+            _make_llm_agent_config(name=f"worker_{i}", instruction=f"Task {i}")
+            for i in range(n_agents)
         ]
-        workflow = _make_workflow(agents=agents, orchestration_type="parallel")
-        hydrator = WorkflowHydrator(mock_tool_registry)
-        root = hydrator.hydrate(workflow)
-
-        assert isinstance(root, ParallelAgent)
-        assert root.name == "test_workflow"
-        assert len(root.sub_agents) == 2
-
-
-class TestHydrateLoopOrchestration:
-    def test_agent_in_loop(self, mock_tool_registry):
-        """Agent in loop -> LoopAgent."""
-        from google.adk.agents.loop_agent import LoopAgent
-
-        workflow = _make_workflow(orchestration_type="loop")
+        workflow = _make_workflow(agents=agents, orchestration_type=orch_type)
         hydrator = WorkflowHydrator(mock_tool_registry)
         root = hydrator.hydrate(workflow)
 
-        assert isinstance(root, LoopAgent)
+        assert isinstance(root, expected_cls)
         assert root.name == "test_workflow"
-        assert len(root.sub_agents) == 1
+        assert len(root.sub_agents) == n_agents
 
 
 class TestHydrateResolvesTools:
@@ -142,52 +179,37 @@ class TestHydrateResolvesTools:
         assert len(llm_agent.tools) == 1
 
 
-class TestHydrateLiteLlmForAnthropicModel:
-    def test_anthropic_model_uses_litellm(self, mock_tool_registry):
-        """Model 'anthropic/claude-sonnet-4-20250514' -> LiteLlm wrapper."""
-        from google.adk.models.base_llm import BaseLlm
-
-        agents = [
-            _make_llm_agent_config(name="claude_agent", model="anthropic/claude-sonnet-4-20250514"),
-        ]
+class TestHydrateLiteLlmModels:
+    @pytest.mark.parametrize("model", ["anthropic/claude-sonnet-4-20250514", "openai/gpt-4o"])
+    def test_prefixed_model_uses_litellm(self, mock_tool_registry, mock_litellm_cls, model):
+        """Models prefixed 'anthropic/' or 'openai/' -> LiteLlm wrapper."""
+        agents = [_make_llm_agent_config(name="litellm_agent", model=model)]
         workflow = _make_workflow(agents=agents)
         hydrator = WorkflowHydrator(mock_tool_registry)
 
-        with patch("pyflow.platform.hydration.hydrator._get_litellm") as mock_get_litellm:
-            mock_litellm_cls = MagicMock()
-            mock_model_instance = MagicMock(spec=BaseLlm)
-            mock_litellm_cls.return_value = mock_model_instance
-            mock_get_litellm.return_value = mock_litellm_cls
-
-            root = hydrator.hydrate(workflow)
-
-            mock_litellm_cls.assert_called_once_with(model="anthropic/claude-sonnet-4-20250514")
-            llm_agent = root.sub_agents[0]
-            assert llm_agent.model == mock_model_instance
-
+        root = hydrator.hydrate(workflow)
 
-class TestHydrateLiteLlmForOpenAIModel:
-    def test_openai_model_uses_litellm(self, mock_tool_registry):
-        """Model 'openai/gpt-4o' -> LiteLlm wrapper."""
-        from google.adk.models.base_llm import BaseLlm
+        mock_litellm_cls.assert_called_once_with(model=model)
+        llm_agent = root.sub_agents[0]
+        assert llm_agent.model == mock_litellm_cls.return_value
 
+    def test_wrapper_shared_across_agents(self, mock_tool_registry, mock_litellm_cls):
+        """Agents (and hydrations) using the same model string share one LiteLlm."""
+        model = "openai/gpt-4o"
         agents = [
-            _make_llm_agent_config(name="gpt_agent", model="openai/gpt-4o"),
+            _make_llm_agent_config(name="first", model=model),
+            _make_llm_agent_config(name="second", model=model),
         ]
-        workflow = _make_workflow(agents=agents)
         hydrator = WorkflowHydrator(mock_tool_registry)
 
-        with patch("pyflow.platform.hydration.hydrator._get_litellm") as mock_get_litellm:
-            mock_litellm_cls = MagicMock()
-            mock_model_instance = MagicMock(spec=BaseLlm)
-            mock_litellm_cls.return_value = mock_model_instance
-            mock_get_litellm.return_value = mock_litellm_cls
-
-            root = hydrator.hydrate(workflow)
+        first_root = hydrator.hydrate(_make_workflow(agents=agents))
+        second_root = hydrator.hydrate(_make_workflow(agents=agents))
 
-            mock_litellm_cls.assert_called_once_with(model="openai/gpt-4o")
-            llm_agent = root.sub_agents[0]
-            assert llm_agent.model == mock_model_instance
+        mock_litellm_cls.assert_called_once_with(model=model)
+        models = {
+            id(agent.model) for root in (first_root, second_root) for agent in root.sub_agents
+        }
+        assert models == {id(mock_litellm_cls.return_value)}
 
 
 class TestHydrateGeminiModelDirect:
@@ -239,7 +261,7 @@ class TestHydrateAgentWithoutTools:
 
 
 class TestHydrateReactOrchestration:
-    def test_react_sets_planner(self, mock_tool_registry):
+    def test_react_sets_planner(self, mock_tool_registry, mock_planners):
         """Orchestration type=react with planner=plan_react -> agent has PlanReActPlanner."""
         agents = [
             _make_llm_agent_config(name="reasoner", instruction="Reason step by step"),
@@ -248,18 +270,12 @@ class TestHydrateReactOrchestration:
         workflow = _make_workflow(agents=agents, orchestration=orch)
         hydrator = WorkflowHydrator(mock_tool_registry)
 
-        with patch("pyflow.platform.hydration.hydrator.PlanReActPlanner") as MockPlanner:
-            mock_planner_instance = MagicMock()
-            MockPlanner.return_value = mock_planner_instance
-
-            root = hydrator.hydrate(workflow)
-
-            from google.adk.agents.llm_agent import LlmAgent
+        root = hydrator.hydrate(workflow)
 
-            assert isinstance(root, LlmAgent)
-            assert root.name == "reasoner"
-            MockPlanner.assert_called_once()
-            assert root.planner is mock_planner_instance
+        assert isinstance(root, LlmAgent)
+        assert root.name == "reasoner"
+        mock_planners["plan_react"].assert_called_once()
+        assert root.planner is mock_planners["plan_react"].return_value
 
     def test_react_without_planner_returns_agent_no_planner(self, mock_tool_registry):
         """Orchestration type=react without planner -> agent returned without planner."""
@@ -271,12 +287,10 @@ class TestHydrateReactOrchestration:
         hydrator = WorkflowHydrator(mock_tool_registry)
         root = hydrator.hydrate(workflow)
 
-        from google.adk.agents.llm_agent import LlmAgent
-
         assert isinstance(root, LlmAgent)
         assert root.name == "reasoner"
 
-    def test_react_builtin_planner(self, mock_tool_registry):
+    def test_react_builtin_planner(self, mock_tool_registry, mock_planners):
         """Orchestration with planner=builtin -> agent has BuiltInPlanner."""
         agents = [
             _make_llm_agent_config(name="thinker", instruction="Think deeply"),
@@ -290,19 +304,13 @@ class TestHydrateReactOrchestration:
         workflow = _make_workflow(agents=agents, orchestration=orch)
         hydrator = WorkflowHydrator(mock_tool_registry)
 
-        with patch("pyflow.platform.hydration.hydrator.BuiltInPlanner") as MockPlanner:
-            mock_planner_instance = MagicMock()
-            MockPlanner.return_value = mock_planner_instance
-
-            root = hydrator.hydrate(workflow)
-
-            from google.adk.agents.llm_agent import LlmAgent
+        root = hydrator.hydrate(workflow)
 
-            assert isinstance(root, LlmAgent)
-            MockPlanner.assert_called_once()
-            assert root.planner is mock_planner_instance
+        assert isinstance(root, LlmAgent)
+        mock_planners["builtin"].assert_called_once()
+        assert root.planner is mock_planners["builtin"].return_value
 
-    def test_react_builtin_planner_no_config(self, mock_tool_registry):
+    def test_react_builtin_planner_no_config(self, mock_tool_registry, mock_planners):
         """Orchestration with planner=builtin but no planner_config -> BuiltInPlanner()."""
         agents = [
             _make_llm_agent_config(name="thinker", instruction="Think"),
@@ -311,20 +319,15 @@ class TestHydrateReactOrchestration:
         workflow = _make_workflow(agents=agents, orchestration=orch)
         hydrator = WorkflowHydrator(mock_tool_registry)
 
-        with patch("pyflow.platform.hydration.hydrator.BuiltInPlanner") as MockPlanner:
-            mock_planner_instance = MagicMock()
-            MockPlanner.return_value = mock_planner_instance
+        root = hydrator.hydrate(workflow)
 
-            root = hydrator.hydrate(workflow)
-            MockPlanner.assert_called_once_with()
-            assert root.planner is mock_planner_instance
+        mock_planners["builtin"].assert_called_once_with()
+        assert root.planner is mock_planners["builtin"].return_value
 
 
 class TestHydrateDagOrchestration:
     def test_dag_creates_dag_agent(self, mock_tool_registry):
         """Orchestration type=dag with nodes -> DagAgent."""
-        from pyflow.platform.agents.dag_agent import DagAgent
-
         agents = [
             _make_llm_agent_config(name="fetch", instruction="Fetch data"),
             _make_llm_agent_config(name="parse", instruction="Parse data"),
@@ -348,15 +351,14 @@ class TestHydrateDagOrchestration:
         assert len(root.sub_agents) == 3
 
         # Verify dependency structure
-        nodes_by_name = {n.name: n for n in root.dag_nodes}
-        assert nodes_by_name["fetch"].depends_on == set()
-        assert nodes_by_name["parse"].depends_on == {"fetch"}
-        assert nodes_by_name["store"].depends_on == {"parse"}
+        assert {n.name: n.depends_on for n in root.dag_nodes} == {
+            "fetch": set(),
+            "parse": {"fetch"},
+            "store": {"parse"},
+        }
 
     def test_dag_parallel_roots(self, mock_tool_registry):
         """DAG with two root nodes (no dependencies) -> both in dag_nodes."""
-        from pyflow.platform.agents.dag_agent import DagAgent
-
         agents = [
             _make_llm_agent_config(name="a", instruction="A"),
             _make_llm_agent_config(name="b", instruction="B"),
@@ -375,17 +377,16 @@ class TestHydrateDagOrchestration:
         root = hydrator.hydrate(workflow)
 
         assert isinstance(root, DagAgent)
-        nodes_by_name = {n.name: n for n in root.dag_nodes}
-        assert nodes_by_name["a"].depends_on == set()
-        assert nodes_by_name["b"].depends_on == set()
-        assert nodes_by_name["c"].depends_on == {"a", "b"}
+        assert {n.name: n.depends_on for n in root.dag_nodes} == {
+            "a": set(),
+            "b": set(),
+            "c": {"a", "b"},
+        }
 
 
 class TestHydrateLlmRoutedOrchestration:
     def test_llm_routed_sets_sub_agents_on_router(self, mock_tool_registry):
         """Orchestration type=llm_routed -> router LlmAgent gets sub_agents."""
-        from google.adk.agents.llm_agent import LlmAgent
-
         agents = [
             _make_llm_agent_config(name="dispatcher", instruction="Route requests"),
             _make_llm_agent_config(name="worker_a", instruction="Handle task A"),
@@ -411,8 +412,6 @@ class TestHydrateLlmRoutedOrchestration:
 class TestHydrateNestedAgents:
     def test_sequential_workflow_agent(self, mock_tool_registry):
         """AgentConfig type=sequential with sub_agents -> SequentialAgent."""
-        from google.adk.agents.sequential_agent import SequentialAgent
-
         agents = [
             _make_llm_agent_config(name="step_a", instruction="Step A"),
             _make_llm_agent_config(name="step_b", instruction="Step B"),
@@ -440,8 +439,6 @@ class TestHydrateNestedAgents:
 
     def test_parallel_workflow_agent(self, mock_tool_registry):
         """AgentConfig type=parallel with sub_agents -> ParallelAgent."""
-        from google.adk.agents.parallel_agent import ParallelAgent
-
         agents = [
             _make_llm_agent_config(name="task_a", instruction="Task A"),
             _make_llm_agent_config(name="task_b", instruction="Task B"),
@@ -463,8 +460,6 @@ class TestHydrateNestedAgents:
 
     def test_loop_workflow_agent(self, mock_tool_registry):
         """AgentConfig type=loop with sub_agents -> LoopAgent."""
-        from google.adk.agents.loop_agent import LoopAgent
-
         agents = [
             _make_llm_agent_config(name="checker", instruction="Check condition"),
             AgentConfig(
@@ -499,8 +494,6 @@ class TestHydrateCallbacks:
         hydrator = WorkflowHydrator(mock_tool_registry)
         root = hydrator.hydrate(workflow)
 
-        import json
-
         llm_agent = root.sub_agents[0]
         assert llm_agent.before_agent_callback is json.dumps
 
@@ -533,8 +526,6 @@ class TestHydrateCallbacks:
 class TestHydrateLoopMaxIterations:
     def test_max_iterations_passed(self, mock_tool_registry):
         """Orchestration type=loop with max_iterations=5 -> LoopAgent.max_iterations=5."""
-        from google.adk.agents.loop_agent import LoopAgent
-
         agents = [_make_llm_agent_config(name="worker", instruction="Work")]
         orch = OrchestrationConfig(type="loop", agents=["worker"], max_iterations=5)
         workflow = _make_workflow(agents=agents, orchestration=orch)
@@ -546,8 +537,6 @@ class TestHydrateLoopMaxIterations:
 
     def test_loop_without_max_iterations(self, mock_tool_registry):
         """Orchestration type=loop without max_iterations -> LoopAgent with default."""
-        from google.adk.agents.loop_agent import LoopAgent
-
         workflow = _make_workflow(orchestration_type="loop")
         hydrator = WorkflowHydrator(mock_tool_registry)
         root = hydrator.hydrate(workflow)
@@ -564,8 +553,6 @@ class TestHydrateLoopMaxIterations:
 class TestHydrateCodeAgent:
     def test_code_agent_hydrated(self, mock_tool_registry):
         """AgentConfig type=code -> CodeAgent with function_path, input_keys, output_key."""
-        from pyflow.platform.agents.code_agent import CodeAgent
-
         agents = [
             AgentConfig(
                 name="compute",
@@ -588,8 +575,6 @@ class TestHydrateCodeAgent:
 
     def test_code_agent_defaults_input_keys_to_empty(self, mock_tool_registry):
         """Code agent with no input_keys -> defaults to empty list."""
-        from pyflow.platform.agents.code_agent import CodeAgent
-
         agents = [
             AgentConfig(
                 name="noop",
@@ -608,8 +593,6 @@ class TestHydrateCodeAgent:
 
     def test_code_agent_in_sequential_with_llm(self, mock_tool_registry):
         """Code agent alongside LLM agent in sequential orchestration."""
-        from pyflow.platform.agents.code_agent import CodeAgent
-
         agents = [
             AgentConfig(
                 name="transform",
@@ -632,9 +615,6 @@ class TestHydrateCodeAgent:
 class TestHydrateToolAgent:
     def test_tool_agent_hydrated(self, mock_tool_registry):
         """AgentConfig type=tool -> ToolAgent with tool_instance, fixed_config, output_key."""
-        from pyflow.platform.agents.tool_agent import ToolAgent
-        from pyflow.tools.base import BasePlatformTool
-
         mock_tool_instance = MagicMock(spec=BasePlatformTool)
         mock_tool_registry.get.return_value = mock_tool_instance
 
@@ -661,9 +641,6 @@ class TestHydrateToolAgent:
 
     def test_tool_agent_defaults_config_to_empty(self, mock_tool_registry):
         """Tool agent with no tool_config -> defaults to empty dict."""
-        from pyflow.platform.agents.tool_agent import ToolAgent
-        from pyflow.tools.base import BasePlatformTool
-
         mock_tool_registry.get.return_value = MagicMock(spec=BasePlatformTool)
 
         agents = [
@@ -709,8 +686,6 @@ class TestHydrateToolAgent:
 class TestHydrateExprAgent:
     def test_expr_agent_hydrated(self, mock_tool_registry):
         """AgentConfig type=expr -> ExprAgent with expression, input_keys, output_key."""
-        from pyflow.platform.agents.expr_agent import ExprAgent
-
         agents = [
             AgentConfig(
                 name="calc",
@@ -733,8 +708,6 @@ class TestHydrateExprAgent:
 
     def test_expr_agent_defaults_input_keys_to_empty(self, mock_tool_registry):
         """Expr agent with no input_keys -> defaults to empty list."""
-        from pyflow.platform.agents.expr_agent import ExprAgent
-
         agents = [
             AgentConfig(
                 name="const",
@@ -753,8 +726,6 @@ class TestHydrateExprAgent:
 
     def test_expr_agent_in_sequential_with_llm(self, mock_tool_registry):
         """Expr agent alongside LLM agent in sequential orchestration."""
-        from pyflow.platform.agents.expr_agent import ExprAgent
-
         agents = [
             AgentConfig(
                 name="margin",
@@ -833,8 +804,6 @@ class TestHydrateExprAgent:
 
     def test_output_schema_creates_pydantic_model(self, mock_tool_registry):
         """AgentConfig with output_schema -> LlmAgent gets Pydantic output_schema."""
-        from pydantic import BaseModel
-
         agents = [
             AgentConfig(
                 name="structured",
@@ -858,8 +827,6 @@ class TestHydrateExprAgent:
 
     def test_input_schema_creates_pydantic_model(self, mock_tool_registry):
         """AgentConfig with input_schema -> LlmAgent gets Pydantic input_schema."""
-        from pydantic import BaseModel
-
         agents = [
             AgentConfig(
                 name="typed_input",
@@ -949,8 +916,6 @@ class TestHydrateExprAgent:
 
     def test_agent_tools_wraps_agents_as_agent_tool(self, mock_tool_registry):
         """AgentConfig with agent_tools -> referenced agents wrapped as AgentTool."""
-        from google.adk.tools.agent_tool import AgentTool
-
         agents = [
             _make_llm_agent_config(name="summarizer", instruction="Summarize text"),
             AgentConfig(
@@ -980,7 +945,6 @@ class TestHydrateExprAgent:
 
         llm_agent = root.sub_agents[0]
         # Only the mock tool from registry, no AgentTool
-        from google.adk.tools.agent_tool import AgentTool
 
         agent_tool_instances = [t for t in llm_agent.tools if isinstance(t, AgentTool)]
         assert len(agent_tool_instances) == 0
@@ -1000,3 +964,24 @@ class TestHydrateExprAgent:
 
         with pytest.raises(ValueError, match="not allowed"):
             hydrator.hydrate(workflow)
+
+
+class TestHydratorSubclassOverrides:
+    def test_overridden_builders_are_dispatched(self, mock_tool_registry):
+        """Subclass overrides of leaf and orchestration builders are used by hydrate()."""
+
+        class CustomHydrator(WorkflowHydrator):
+            def _build_llm_agent(self, config):
+                agent = super()._build_llm_agent(config)
+                agent.description = "custom leaf"
+                return agent
+
+            def _orchestrate_sequential(self, workflow, agents):
+                root = super()._orchestrate_sequential(workflow, agents)
+                root.description = "custom root"
+                return root
+
+        root = CustomHydrator(mock_tool_registry).hydrate(_make_workflow())
+
+        assert root.description == "custom root"
+        assert root.sub_agents[0].description == "custom leaf"
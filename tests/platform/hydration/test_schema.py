@@ -143,3 +143,22 @@ class TestDefaults:
         Model = json_schema_to_pydantic(schema, "Fallback")
         instance = Model(data="hello")
         assert instance.data == "hello"
+
+
+class TestJsonSchemaModelCache:
+    def test_same_schema_and_name_reuse_model(self):
+        schema = {"type": "object", "properties": {"x": {"type": "integer"}}, "required": ["x"]}
+        reordered = {"required": ["x"], "properties": {"x": {"type": "integer"}}, "type": "object"}
+
+        model = json_schema_to_pydantic(schema, "Cached")
+
+        assert json_schema_to_pydantic(reordered, "Cached") is model
+
+    def test_different_name_builds_new_model(self):
+        schema = {"type": "object", "properties": {"x": {"type": "string"}}}
+
+        first = json_schema_to_pydantic(schema, "First")
+        second = json_schema_to_pydantic(schema, "Second")
+
+        assert first is not second
+        assert second.__name__ == "Second"
@@ -35,3 +35,14 @@ def test_scan_agent_packages_empty_dir(tmp_path: Path) -> None:
 def test_scan_agent_packages_nonexistent(tmp_path: Path) -> None:
     """Nonexistent directory returns empty list."""
     assert scan_agent_packages(tmp_path / "missing") == []
+
+
+def test_scan_agent_packages_skips_files(tmp_path: Path) -> None:
+    """Regular files next to packages are ignored."""
+    (tmp_path / "workflow.yaml").write_text("name: root\n")
+    (tmp_path / "README.md").write_text("docs\n")
+    pkg = tmp_path / "agent_a"
+    pkg.mkdir()
+    (pkg / "workflow.yaml").write_text("name: a\n")
+
+    assert scan_agent_packages(tmp_path) == [pkg]
@@ -7,8 +7,9 @@ import pytest
 from google.adk.tools import FunctionTool
 from google.adk.tools.tool_context import ToolContext
 
-from pyflow.models.agent import OpenApiToolConfig
+from pyflow.models.agent import OpenApiAuthConfig, OpenApiToolConfig
 from pyflow.models.tool import ToolMetadata
+from pyflow.platform.registry import tool_registry as tool_registry_module
 from pyflow.platform.registry.tool_registry import ToolRegistry
 from pyflow.tools.base import BasePlatformTool
 
@@ -29,6 +30,14 @@ def registry() -> ToolRegistry:
     return ToolRegistry()
 
 
+@pytest.fixture(autouse=True)
+def _clear_openapi_toolset_cache():
+    # Toolsets are cached per process; keep patched OpenAPIToolset mocks per test.
+    tool_registry_module._load_openapi_toolset.cache_clear()
+    yield
+    tool_registry_module._load_openapi_toolset.cache_clear()
+
+
 # -- Tests --------------------------------------------------------------------
 
 
@@ -103,6 +112,24 @@ def test_resolve_tools_unknown_raises_keyerror(registry: ToolRegistry) -> None:
         registry.resolve_tools(["does_not_exist"])
 
 
+def test_resolve_tools_reuses_tools_per_ref_list(registry: ToolRegistry) -> None:
+    """Repeated refs share tool objects, but every call gets its own list."""
+    registry.discover()
+    first = registry.resolve_tools(["http_request", "transform"])
+    second = registry.resolve_tools(["http_request", "transform"])
+    assert first is not second
+    assert all(a is b for a, b in zip(first, second, strict=True))
+
+
+def test_register_invalidates_resolved_tools(registry: ToolRegistry) -> None:
+    """Registering a tool drops cached resolutions so the new class is used."""
+    registry.discover()
+    before = registry.resolve_tools(["http_request"])
+    registry.register(_DummyTool)
+    after = registry.resolve_tools(["http_request"])
+    assert before[0] is not after[0]
+
+
 # -- Built-in tool catalog tests ----------------------------------------------
 
 
@@ -269,6 +296,40 @@ class TestOpenApiToolRegistration:
         assert "myapi" in registry
         MockToolset.assert_called_once()
 
+    def test_openapi_toolset_shared_across_registries(self, tmp_path) -> None:
+        """An unchanged spec is parsed once, even when a new registry registers it."""
+        (tmp_path / "spec.yaml").write_text("openapi: '3.0.0'")
+        configs = {"myapi": OpenApiToolConfig(spec="spec.yaml")}
+
+        with patch(
+            "google.adk.tools.openapi_tool.openapi_spec_parser.openapi_toolset.OpenAPIToolset"
+        ) as MockToolset:
+            first, second = ToolRegistry(), ToolRegistry()
+            first.register_openapi_tools(configs, base_dir=tmp_path)
+            second.register_openapi_tools(configs, base_dir=tmp_path)
+
+        MockToolset.assert_called_once()
+        assert first.get_tool_union("myapi") is second.get_tool_union("myapi")
+
+    def test_openapi_toolset_rebuilt_when_spec_or_auth_changes(self, tmp_path, monkeypatch) -> None:
+        """Editing the spec file or the auth env var builds a new toolset."""
+        spec_file = tmp_path / "spec.yaml"
+        spec_file.write_text("openapi: '3.0.0'")
+        auth = OpenApiAuthConfig(type="bearer", token_env="MYAPI_TOKEN")
+        configs = {"myapi": OpenApiToolConfig(spec="spec.yaml", auth=auth)}
+        monkeypatch.setenv("MYAPI_TOKEN", "old")
+
+        with patch(
+            "google.adk.tools.openapi_tool.openapi_spec_parser.openapi_toolset.OpenAPIToolset"
+        ) as MockToolset:
+            ToolRegistry().register_openapi_tools(configs, base_dir=tmp_path)
+            spec_file.write_text("openapi: '3.1.0'\ninfo: {}")
+            ToolRegistry().register_openapi_tools(configs, base_dir=tmp_path)
+            monkeypatch.setenv("MYAPI_TOKEN", "new")
+            ToolRegistry().register_openapi_tools(configs, base_dir=tmp_path)
+
+        assert MockToolset.call_count == 3
+
     def test_len_includes_openapi(self, tmp_path) -> None:
         """__len__ includes both custom and OpenAPI tools."""
         spec_file = tmp_path / "spec.yaml"
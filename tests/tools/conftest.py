@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import ipaddress
+from collections.abc import Callable
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from pyflow.tools import security
+from pyflow.tools.client import aclose_clients
+
+# Public address returned for every hostname so SSRF checks never touch real DNS.
+PUBLIC_IP = ipaddress.ip_address("93.184.216.34")
+
+
+@pytest.fixture(autouse=True)
+def _bypass_ssrf_dns(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    resolver = MagicMock(return_value=(PUBLIC_IP,))
+    monkeypatch.setattr(security, "_resolve_host", resolver)
+    return resolver
+
+
+@pytest.fixture(autouse=True)
+async def _close_shared_clients():
+    yield
+    await aclose_clients()
+
+
+@pytest.fixture
+def mock_transport(monkeypatch: pytest.MonkeyPatch):
+    """Route every httpx.AsyncClient through an ``httpx.MockTransport``.
+
+    Call the fixture with a handler ``(request) -> httpx.Response`` (or one that
+    raises an ``httpx`` exception). Returns the list of captured requests so tests
+    can assert on the real ``httpx.Request`` that would have hit the network.
+    """
+
+    def install(handler: Callable[[httpx.Request], httpx.Response]) -> list[httpx.Request]:
+        requests: list[httpx.Request] = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return handler(request)
+
+        transport = httpx.MockTransport(record)
+        client_cls = httpx.AsyncClient
+
+        def client_with_mock_transport(**kwargs) -> httpx.AsyncClient:
+            # Drop environment proxy mounts so every request reaches the mock.
+            return client_cls(**{**kwargs, "transport": transport, "mounts": None})
+
+        monkeypatch.setattr(httpx, "AsyncClient", client_with_mock_transport)
+        return requests
+
+    return install
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+from unittest.mock import MagicMock
 
 import httpx
 
@@ -8,33 +9,25 @@ from pyflow.tools.alert import AlertTool
 
 
 class TestAlertToolExecute:
-    async def test_successful_post(self):
+    async def test_successful_post(self, mock_transport):
         tool = AlertTool()
+        requests = mock_transport(lambda req: httpx.Response(200))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-
-        mock_client = AsyncMock()
-        mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("pyflow.tools.alert.httpx.AsyncClient", return_value=mock_client):
-            result = await tool.execute(
-                tool_context=MagicMock(),
-                webhook_url="https://hooks.example.com/abc",
-                message="Server is down!",
-            )
+        result = await tool.execute(
+            tool_context=MagicMock(),
+            webhook_url="https://hooks.example.com/abc",
+            message="Server is down!",
+        )
 
         assert isinstance(result, dict)
         assert result["status"] == "success"
         assert result["status_code"] == 200
         assert result["sent"] is True
         assert result["error"] is None
-        mock_client.post.assert_called_once_with(
-            "https://hooks.example.com/abc",
-            json={"message": "Server is down!"},
-        )
+        assert len(requests) == 1
+        assert requests[0].method == "POST"
+        assert str(requests[0].url) == "https://hooks.example.com/abc"
+        assert json.loads(requests[0].content) == {"message": "Server is down!"}
 
     async def test_ssrf_blocked(self):
         tool = AlertTool()
@@ -59,43 +52,34 @@ class TestAlertToolExecute:
         assert result["sent"] is False
         assert "SSRF blocked" in result["error"]
 
-    async def test_http_error(self):
+    async def test_http_error(self, mock_transport):
         tool = AlertTool()
 
-        mock_client = AsyncMock()
-        mock_client.post = AsyncMock(side_effect=httpx.HTTPError("timeout"))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ReadTimeout("timeout", request=request)
 
-        with patch("pyflow.tools.alert.httpx.AsyncClient", return_value=mock_client):
-            result = await tool.execute(
-                tool_context=MagicMock(),
-                webhook_url="https://hooks.example.com/abc",
-                message="test",
-            )
+        mock_transport(handler)
+
+        result = await tool.execute(
+            tool_context=MagicMock(),
+            webhook_url="https://hooks.example.com/abc",
+            message="test",
+        )
 
         assert result["status"] == "error"
         assert result["sent"] is False
         assert result["status_code"] == 0
         assert "timeout" in result["error"]
 
-    async def test_server_error_status(self):
+    async def test_server_error_status(self, mock_transport):
         tool = AlertTool()
+        mock_transport(lambda req: httpx.Response(500))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-
-        mock_client = AsyncMock()
-        mock_client.post = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("pyflow.tools.alert.httpx.AsyncClient", return_value=mock_client):
-            result = await tool.execute(
-                tool_context=MagicMock(),
-                webhook_url="https://hooks.example.com/abc",
-                message="test",
-            )
+        result = await tool.execute(
+            tool_context=MagicMock(),
+            webhook_url="https://hooks.example.com/abc",
+            message="test",
+        )
 
         assert result["status"] == "success"
         assert result["status_code"] == 500
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import ipaddress
+from unittest.mock import MagicMock
+
+import httpcore
+import httpx
+import pytest
+
+from pyflow.tools import client as client_module
+from pyflow.tools.client import (
+    PinnedTransport,
+    SSRFBlockedError,
+    _PinnedNetworkBackend,
+    aclose_clients,
+    get_client,
+)
+from pyflow.tools.http import HttpTool
+
+_OK_RESPONSE = [
+    b"HTTP/1.1 200 OK\r\n",
+    b"Content-Type: application/json\r\n",
+    b"Content-Length: 12\r\n",
+    b"\r\n",
+    b'{"ok": true}',
+]
+
+
+class RecordingBackend(httpcore.AsyncMockBackend):
+    """Mock backend that records the host each TCP connection was dialed to."""
+
+    def __init__(self, buffer: list[bytes], refuse: set[str] = frozenset()) -> None:
+        super().__init__(buffer)
+        self.dialed: list[str] = []
+        self._refuse = refuse
+
+    async def connect_tcp(self, host, port, timeout=None, local_address=None, socket_options=None):
+        self.dialed.append(host)
+        if host in self._refuse:
+            raise httpcore.ConnectError(f"refused: {host}")
+        return await super().connect_tcp(host, port, timeout, local_address, socket_options)
+
+
+class TestPinnedNetworkBackend:
+    async def test_dials_resolved_ip_not_hostname(self, _bypass_ssrf_dns):
+        inner = RecordingBackend([])
+        backend = _PinnedNetworkBackend(inner)
+
+        await backend.connect_tcp("example.com", 443)
+
+        assert inner.dialed == ["93.184.216.34"]
+        _bypass_ssrf_dns.assert_called_once_with("example.com")
+
+    async def test_private_resolution_blocked(self, _bypass_ssrf_dns):
+        _bypass_ssrf_dns.return_value = (ipaddress.ip_address("10.0.0.5"),)
+        inner = RecordingBackend([])
+        backend = _PinnedNetworkBackend(inner)
+
+        with pytest.raises(SSRFBlockedError, match="SSRF blocked"):
+            await backend.connect_tcp("rebind.example.com", 80)
+        assert inner.dialed == []
+
+    async def test_falls_back_to_next_address(self, _bypass_ssrf_dns):
+        _bypass_ssrf_dns.return_value = (
+            ipaddress.ip_address("93.184.216.34"),
+            ipaddress.ip_address("93.184.216.35"),
+        )
+        inner = RecordingBackend([], refuse={"93.184.216.34"})
+        backend = _PinnedNetworkBackend(inner)
+
+        await backend.connect_tcp("example.com", 80)
+
+        assert inner.dialed == ["93.184.216.34", "93.184.216.35"]
+
+    async def test_unresolvable_host_is_connect_error(self, _bypass_ssrf_dns):
+        _bypass_ssrf_dns.side_effect = OSError("Name or service not known")
+        backend = _PinnedNetworkBackend(RecordingBackend([]))
+
+        with pytest.raises(httpcore.ConnectError):
+            await backend.connect_tcp("nope.invalid", 80)
+
+
+class TestPinnedTransport:
+    async def test_requests_dial_through_pinned_backend(self, _bypass_ssrf_dns):
+        inner = RecordingBackend(_OK_RESPONSE)
+
+        async with httpx.AsyncClient(transport=PinnedTransport(inner)) as client:
+            resp = await client.get("http://example.com/")
+
+        assert resp.json() == {"ok": True}
+        # The hostname was resolved and validated, and the socket opened to the IP.
+        assert inner.dialed == ["93.184.216.34"]
+        _bypass_ssrf_dns.assert_called_once_with("example.com")
+
+    async def test_httpcore_errors_surface_as_httpx_errors(self, _bypass_ssrf_dns):
+        inner = RecordingBackend([], refuse={"93.184.216.34"})
+
+        async with httpx.AsyncClient(transport=PinnedTransport(inner)) as client:
+            with pytest.raises(httpx.ConnectError, match="refused"):
+                await client.get("http://example.com/")
+
+
+class TestHttpToolPinning:
+    async def test_single_dns_lookup_per_request(self, monkeypatch, _bypass_ssrf_dns):
+        inner = RecordingBackend(_OK_RESPONSE)
+        monkeypatch.setattr(
+            client_module, "PinnedTransport", functools.partial(PinnedTransport, inner)
+        )
+
+        result = await HttpTool().execute(tool_context=MagicMock(), url="http://example.com/")
+
+        assert result["status"] == "success"
+        assert result["body"] == {"ok": True}
+        assert inner.dialed == ["93.184.216.34"]
+        _bypass_ssrf_dns.assert_called_once_with("example.com")
+
+    async def test_rebinding_to_private_address_blocked(self, monkeypatch, _bypass_ssrf_dns):
+        _bypass_ssrf_dns.return_value = (ipaddress.ip_address("169.254.169.254"),)
+        inner = RecordingBackend(_OK_RESPONSE)
+        monkeypatch.setattr(
+            client_module, "PinnedTransport", functools.partial(PinnedTransport, inner)
+        )
+
+        result = await HttpTool().execute(tool_context=MagicMock(), url="http://metadata.test/")
+
+        assert result["status"] == "error"
+        assert "SSRF blocked" in result["error"]
+        assert inner.dialed == []
+
+    def test_ssrf_blocked_error_is_httpx_error(self):
+        assert issubclass(SSRFBlockedError, httpx.HTTPError)
+
+
+_PROXY_ENV_VARS = ("http_proxy", "https_proxy", "all_proxy", "no_proxy")
+
+
+@pytest.fixture
+async def proxy_server(monkeypatch):
+    """Serve a one-response HTTP proxy on loopback and point HTTP_PROXY at it.
+
+    Returns the list of request lines the proxy received.
+    """
+    received: list[bytes] = []
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        received.append((await reader.readuntil(b"\r\n\r\n")).split(b"\r\n")[0])
+        writer.write(b"".join(_OK_RESPONSE))
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    for name in _PROXY_ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+    monkeypatch.setenv("HTTP_PROXY", f"http://127.0.0.1:{port}")
+    yield received
+    server.close()
+    await server.wait_closed()
+
+
+class TestEnvironmentProxy:
+    async def test_pinned_client_sends_through_proxy(self, proxy_server, _bypass_ssrf_dns):
+        resp = await get_client().get("http://example.com/rates")
+
+        assert resp.json() == {"ok": True}
+        assert proxy_server == [b"GET http://example.com/rates HTTP/1.1"]
+        _bypass_ssrf_dns.assert_called_once_with("example.com")
+
+    async def test_private_target_blocked_before_proxy(self, proxy_server, _bypass_ssrf_dns):
+        _bypass_ssrf_dns.return_value = (ipaddress.ip_address("169.254.169.254"),)
+
+        with pytest.raises(SSRFBlockedError, match="SSRF blocked"):
+            await get_client().get("http://metadata.test/")
+        assert proxy_server == []
+
+    async def test_no_proxy_hosts_use_pinned_transport(
+        self, proxy_server, monkeypatch, _bypass_ssrf_dns
+    ):
+        monkeypatch.setenv("NO_PROXY", "example.com")
+        inner = RecordingBackend(_OK_RESPONSE)
+        monkeypatch.setattr(
+            client_module, "PinnedTransport", functools.partial(PinnedTransport, inner)
+        )
+
+        resp = await get_client().get("http://api.example.com/")
+
+        assert resp.json() == {"ok": True}
+        assert proxy_server == []
+        assert inner.dialed == ["93.184.216.34"]
+
+
+class TestSharedClient:
+    async def test_reused_across_calls(self):
+        assert get_client() is get_client()
+
+    async def test_pinned_and_unpinned_clients_are_separate(self):
+        pinned = get_client()
+        unpinned = get_client(pinned=False)
+
+        assert pinned is not unpinned
+        assert isinstance(pinned._transport, PinnedTransport)
+        assert not isinstance(unpinned._transport, PinnedTransport)
+
+    async def test_aclose_clients_closes_and_resets(self):
+        client = get_client()
+
+        await aclose_clients()
+
+        assert client.is_closed
+        assert get_client() is not client
+
+    async def test_reused_across_tool_requests(self, monkeypatch):
+        inner = RecordingBackend(_OK_RESPONSE * 2)
+        monkeypatch.setattr(
+            client_module, "PinnedTransport", functools.partial(PinnedTransport, inner)
+        )
+        tool = HttpTool()
+
+        await tool.execute(tool_context=MagicMock(), url="http://example.com/a")
+        await tool.execute(tool_context=MagicMock(), url="http://example.com/b")
+
+        # The second request rides the kept-alive connection from the first.
+        assert inner.dialed == ["93.184.216.34"]
+
+    async def test_cookies_not_carried_between_calls(self, mock_transport):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, headers={"set-cookie": "session=abc; Path=/"}, json={})
+
+        requests = mock_transport(handler)
+        tool = HttpTool()
+
+        await tool.execute(tool_context=MagicMock(), url="http://example.com/login")
+        await tool.execute(tool_context=MagicMock(), url="http://example.com/profile")
+
+        assert "cookie" not in requests[1].headers
+        assert not get_client().cookies
+
+    def test_each_loop_closes_its_own_clients(self):
+        async def current_client() -> httpx.AsyncClient:
+            return get_client()
+
+        first, second = asyncio.new_event_loop(), asyncio.new_event_loop()
+        try:
+            old = first.run_until_complete(current_client())
+            new = second.run_until_complete(current_client())
+            assert old is not new
+
+            # Switching loops must not orphan the first loop's client.
+            first.run_until_complete(aclose_clients())
+            assert old.is_closed
+            assert not new.is_closed
+
+            second.run_until_complete(aclose_clients())
+            assert new.is_closed
+        finally:
+            first.close()
+            second.close()
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
-from pyflow.tools.condition import ConditionTool
+import pytest
+
+from pyflow.tools.condition import ConditionTool, _compile_expression
 
 
 # Dangerous expression strings built dynamically so static analysis
@@ -93,3 +95,13 @@ class TestConditionToolExecute:
         from pyflow.tools.base import get_registered_tools
 
         assert "condition" in get_registered_tools()
+
+
+class TestCompileExpressionCache:
+    def test_same_expression_shares_code_object(self):
+        assert _compile_expression("1 + 1 == 2") is _compile_expression("1 + 1 == 2")
+
+    def test_unsafe_expression_still_raises_on_repeat(self):
+        for _ in range(2):
+            with pytest.raises(ValueError, match="not allowed"):
+                _compile_expression("__import__('os')")
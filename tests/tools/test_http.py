@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock
 
 import httpx
 
@@ -9,74 +9,61 @@ from pyflow.tools.http import HttpTool
 
 
 class TestHttpToolExecute:
-    async def test_get_request(self):
+    async def test_get_request(self, mock_transport):
         tool = HttpTool()
+        requests = mock_transport(lambda req: httpx.Response(200, json={"data": "test"}))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = httpx.Headers({"content-type": "application/json"})
-        mock_response.json.return_value = {"data": "test"}
-        mock_response.text = '{"data": "test"}'
-
-        mock_client = AsyncMock()
-        mock_client.request = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("pyflow.tools.http.httpx.AsyncClient", return_value=mock_client):
-            result = await tool.execute(
-                tool_context=MagicMock(),
-                url="https://example.com/api",
-            )
+        result = await tool.execute(
+            tool_context=MagicMock(),
+            url="https://example.com/api",
+        )
 
         assert isinstance(result, dict)
         assert result["status"] == "success"
         assert result["status_code"] == 200
         assert result["body"] == {"data": "test"}
         assert result["error"] is None
-        mock_client.request.assert_called_once_with(
-            method="GET",
-            url="https://example.com/api",
-            headers={},
-            json=None,
-        )
+        assert len(requests) == 1
+        assert requests[0].method == "GET"
+        assert str(requests[0].url) == "https://example.com/api"
+        assert requests[0].content == b""
 
-    async def test_post_with_json_body_and_headers(self):
+    async def test_post_with_json_body_and_headers(self, mock_transport):
         tool = HttpTool()
-
-        mock_response = MagicMock()
-        mock_response.status_code = 201
-        mock_response.headers = httpx.Headers({"content-type": "application/json"})
-        mock_response.json.return_value = {"created": True}
-        mock_response.text = '{"created": true}'
-
-        mock_client = AsyncMock()
-        mock_client.request = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        requests = mock_transport(lambda req: httpx.Response(201, json={"created": True}))
 
         headers_json = json.dumps({"Authorization": "Bearer token123"})
         body_json = json.dumps({"key": "value"})
 
-        with patch("pyflow.tools.http.httpx.AsyncClient", return_value=mock_client):
-            result = await tool.execute(
-                tool_context=MagicMock(),
-                url="https://example.com/api",
-                method="POST",
-                headers=headers_json,
-                body=body_json,
-            )
+        result = await tool.execute(
+            tool_context=MagicMock(),
+            url="https://example.com/api",
+            method="POST",
+            headers=headers_json,
+            body=body_json,
+        )
 
         assert result["status"] == "success"
         assert result["status_code"] == 201
         assert result["body"] == {"created": True}
-        mock_client.request.assert_called_once_with(
-            method="POST",
-            url="https://example.com/api",
-            headers={"Authorization": "Bearer token123"},
-            json={"key": "value"},
+        assert len(requests) == 1
+        assert requests[0].method == "POST"
+        assert str(requests[0].url) == "https://example.com/api"
+        assert requests[0].headers["authorization"] == "Bearer token123"
+        assert json.loads(requests[0].content) == {"key": "value"}
+
+    async def test_non_json_response_body_returned_as_text(self, mock_transport):
+        tool = HttpTool()
+        mock_transport(lambda req: httpx.Response(200, text="plain body"))
+
+        result = await tool.execute(
+            tool_context=MagicMock(),
+            url="https://example.com/text",
         )
 
+        assert result["status"] == "success"
+        assert result["body"] == "plain body"
+
     async def test_ssrf_blocked_by_default(self):
         tool = HttpTool()
         result = await tool.execute(
@@ -87,101 +74,75 @@ class TestHttpToolExecute:
         assert result["status_code"] == 0
         assert "SSRF blocked" in result["error"]
 
-    async def test_ssrf_allowed_with_flag(self):
+    async def test_ssrf_allowed_with_flag(self, mock_transport):
         tool = HttpTool()
+        requests = mock_transport(lambda req: httpx.Response(200, json={"local": True}))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = httpx.Headers({"content-type": "application/json"})
-        mock_response.json.return_value = {"local": True}
-        mock_response.text = '{"local": true}'
-
-        mock_client = AsyncMock()
-        mock_client.request = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("pyflow.tools.http.httpx.AsyncClient", return_value=mock_client):
-            result = await tool.execute(
-                tool_context=MagicMock(),
-                url="http://localhost:8080/api",
-                allow_private=True,
-            )
+        result = await tool.execute(
+            tool_context=MagicMock(),
+            url="http://localhost:8080/api",
+            allow_private=True,
+        )
 
         assert result["status"] == "success"
         assert result["status_code"] == 200
         assert result["body"] == {"local": True}
+        assert str(requests[0].url) == "http://localhost:8080/api"
 
-    async def test_network_error(self):
+    async def test_network_error(self, mock_transport):
         tool = HttpTool()
 
-        mock_client = AsyncMock()
-        mock_client.request = AsyncMock(side_effect=httpx.HTTPError("connection failed"))
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection failed", request=request)
 
-        with patch("pyflow.tools.http.httpx.AsyncClient", return_value=mock_client):
-            result = await tool.execute(
-                tool_context=MagicMock(),
-                url="https://example.com/fail",
-            )
+        mock_transport(handler)
+
+        result = await tool.execute(
+            tool_context=MagicMock(),
+            url="https://example.com/fail",
+        )
 
         assert result["status"] == "error"
         assert result["status_code"] == 0
         assert "connection failed" in result["error"]
 
-    async def test_invalid_json_headers_gracefully_handled(self):
+    async def test_invalid_json_headers_gracefully_handled(self, mock_transport):
         """Invalid JSON headers string should fall back to empty dict."""
         tool = HttpTool()
+        requests = mock_transport(lambda req: httpx.Response(200, json={}))
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = httpx.Headers({})
-        mock_response.json.return_value = {}
-        mock_response.text = "{}"
-
-        mock_client = AsyncMock()
-        mock_client.request = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
+        result = await tool.execute(
+            tool_context=MagicMock(),
+            url="https://example.com/api",
+            headers="not valid json{{{",
+        )
 
-        with patch("pyflow.tools.http.httpx.AsyncClient", return_value=mock_client):
-            result = await tool.execute(
-                tool_context=MagicMock(),
-                url="https://example.com/api",
-                headers="not valid json{{{",
-            )
+        await tool.execute(tool_context=MagicMock(), url="https://example.com/api")
 
         assert result["status"] == "success"
         assert result["status_code"] == 200
-        # Invalid JSON headers should fall back to empty dict
-        mock_client.request.assert_called_once()
-        call_kwargs = mock_client.request.call_args[1]
-        assert call_kwargs["headers"] == {}  # safe_json_parse returns default={}
+        # Invalid JSON headers fall back to an empty dict: httpx defaults only
+        assert len(requests) == 2
+        assert requests[0].headers.multi_items() == requests[1].headers.multi_items()
 
-    async def test_timeout_clamped(self):
+    async def test_timeout_clamped(self, mock_transport):
         """Timeout values are clamped to [1, 300]."""
         tool = HttpTool()
+        requests = mock_transport(lambda req: httpx.Response(200, json={}))
+
+        await tool.execute(
+            tool_context=MagicMock(),
+            url="https://example.com/api",
+            timeout=0,
+        )
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = httpx.Headers({})
-        mock_response.json.return_value = {}
-        mock_response.text = "{}"
-
-        mock_client = AsyncMock()
-        mock_client.request = AsyncMock(return_value=mock_response)
-        mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-        mock_client.__aexit__ = AsyncMock(return_value=False)
-
-        with patch("pyflow.tools.http.httpx.AsyncClient", return_value=mock_client) as mock_cls:
-            await tool.execute(
-                tool_context=MagicMock(),
-                url="https://example.com/api",
-                timeout=0,
-            )
-            # Should be clamped to 1
-            mock_cls.assert_called_once_with(timeout=1)
+        # Should be clamped to 1
+        assert requests[0].extensions["timeout"] == {
+            "connect": 1,
+            "read": 1,
+            "write": 1,
+            "pool": 1,
+        }
 
     def test_auto_registered(self):
         from pyflow.tools.base import get_registered_tools
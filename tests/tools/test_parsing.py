@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from pyflow.tools.parsing import safe_json_parse
+import json
+import math
+
+import pytest
+
+from pyflow.tools import parsing
+from pyflow.tools.parsing import json_loads, safe_json_parse
 
 
 class TestSafeJsonParse:
@@ -21,3 +27,55 @@ class TestSafeJsonParse:
 
     def test_custom_default(self):
         assert safe_json_parse("bad", default={}) == {}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        if parsing.orjson is None:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(parsing, "orjson", None)
+    return request.param
+
+
+class TestJsonHelpers:
+    def test_round_trip(self, backend):
+        data = {"rates": [{"date": "2024-01-01", "value": 4012.5}], "ok": True}
+        assert json_loads(json.dumps(data)) == data
+
+    def test_loads_accepts_bytes(self, backend):
+        assert json_loads(b'{"key": "value"}') == {"key": "value"}
+
+    def test_invalid_json_raises_value_error(self, backend):
+        with pytest.raises(ValueError):
+            json_loads("not json")
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            '{"id": 123456789012345678901234567890}',
+            "18446744073709551616",
+            "-9223372036854775809",
+            "[9223372036854775807, 1.5e308]",
+            '"\\ud800"',
+        ],
+    )
+    def test_loads_matches_stdlib(self, backend, text):
+        assert json_loads(text) == json.loads(text)
+        assert json_loads(text.encode()) == json.loads(text)
+
+    def test_loads_big_int_stays_int(self, backend):
+        assert json_loads('{"id": 123456789012345678901234567890}') == {
+            "id": 123456789012345678901234567890
+        }
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("1e400", math.inf), ("-1e400", -math.inf), ("[Infinity]", [math.inf])],
+    )
+    def test_loads_non_finite(self, backend, text, expected):
+        assert json_loads(text) == expected
+
+    def test_loads_nan(self, backend):
+        assert math.isnan(safe_json_parse("NaN"))
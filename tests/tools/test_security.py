@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import ipaddress
+import socket
+from unittest.mock import patch
+
 import pytest
 
-from pyflow.tools.security import is_private_url
+from pyflow.tools import security
+
+# Bound at import so the autouse DNS stub in conftest does not replace it here.
+from pyflow.tools.security import _is_blocked_ip, _resolve_host, is_private_url
 
 
 class TestIsPrivateUrl:
@@ -11,12 +18,22 @@ class TestIsPrivateUrl:
         [
             "http://127.0.0.1/api",
             "http://localhost/api",
+            "http://LOCALHOST:80/api",
+            "http://localhost./api",
+            "http://app.localhost/api",
+            "http://ip6-localhost/api",
+            "http://127.0.0.1./api",
             "http://10.0.0.1/api",
             "http://172.16.0.1/api",
             "http://192.168.1.1/api",
             "http://169.254.169.254/latest/meta-data",
             "http://[::1]/api",
             "http://0.0.0.0/api",
+            "http://100.64.0.1/api",
+            "http://[::ffff:10.0.0.1]/api",
+            "http://[fd00::1]/api",
+            "http://[fe80::1]/api",
+            "http://[2001:db8::1]/api",
         ],
     )
     def test_blocks_private_urls(self, url: str):
@@ -27,8 +44,105 @@ class TestIsPrivateUrl:
         [
             "https://api.example.com/data",
             "https://8.8.8.8/dns",
+            "https://[2606:4700:4700::1111]/dns",
             "https://httpbin.org/get",
+            "https://localhost.example.com/api",
         ],
     )
     def test_allows_public_urls(self, url: str):
         assert is_private_url(url) is False
+
+
+class TestBlockedIpTable:
+    @pytest.mark.parametrize(
+        "ip",
+        [
+            "0.1.2.3",
+            "9.255.255.255",
+            "10.0.0.0",
+            "11.0.0.1",
+            "100.63.255.255",
+            "127.255.255.255",
+            "169.254.0.1",
+            "172.15.255.255",
+            "172.31.255.255",
+            "172.32.0.0",
+            "192.0.0.7",
+            "192.0.2.1",
+            "192.168.255.255",
+            "198.18.0.1",
+            "203.0.113.9",
+            "224.0.0.1",
+            "239.255.255.255",
+            "240.0.0.1",
+            "255.255.255.255",
+            "::",
+            "::1",
+            "2001:db8::1",
+            "2001:4860:4860::8888",
+            "fc00::1",
+            "fe80::1",
+        ],
+    )
+    def test_matches_stdlib_classification(self, ip: str):
+        addr = ipaddress.ip_address(ip)
+        expected = addr.is_private or addr.is_loopback or addr.is_link_local or addr.is_reserved
+        assert _is_blocked_ip(addr) is expected
+
+    @pytest.mark.parametrize("ip", ["100.64.0.0", "100.127.255.255", "192.0.0.8"])
+    def test_blocks_cgnat_and_ietf_protocol_block(self, ip: str):
+        assert _is_blocked_ip(ipaddress.ip_address(ip)) is True
+
+
+class TestHostnameResolution:
+    def test_hostname_is_not_resolved(self, _bypass_ssrf_dns):
+        _bypass_ssrf_dns.return_value = (ipaddress.ip_address("10.1.2.3"),)
+        # Resolution happens at connect time in PinnedTransport, never here.
+        assert is_private_url("https://internal.example.com/api") is False
+        _bypass_ssrf_dns.assert_not_called()
+
+    def test_ip_literal_skips_resolution(self, _bypass_ssrf_dns):
+        assert is_private_url("https://8.8.8.8/dns") is False
+        _bypass_ssrf_dns.assert_not_called()
+
+
+class TestResolveHost:
+    def setup_method(self):
+        security._dns_cache.clear()
+
+    def test_resolution_cached_within_ttl(self):
+        addrinfo = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))] * 2
+        with patch("pyflow.tools.security.socket.getaddrinfo", return_value=addrinfo) as gai:
+            first = _resolve_host("example.com")
+            second = _resolve_host("example.com")
+
+        assert first == second == (ipaddress.ip_address("93.184.216.34"),)
+        gai.assert_called_once_with("example.com", None, type=socket.SOCK_STREAM)
+
+    def test_ttl_counts_from_each_lookup(self):
+        addrinfo = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+        # A lookup just before a multiple of the TTL must still be reused for a full TTL.
+        ttl = security._DNS_TTL
+        with (
+            patch("pyflow.tools.security.socket.getaddrinfo", return_value=addrinfo) as gai,
+            patch(
+                "pyflow.tools.security.time.monotonic",
+                side_effect=[ttl - 0.1, ttl + 1.0, 2 * ttl],
+            ),
+        ):
+            _resolve_host("example.com")
+            _resolve_host("example.com")
+            assert gai.call_count == 1
+            _resolve_host("example.com")
+
+        assert gai.call_count == 2
+
+    def test_failed_resolution_not_cached(self):
+        addrinfo = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 0))]
+        with patch(
+            "pyflow.tools.security.socket.getaddrinfo",
+            side_effect=[socket.gaierror("temporary failure"), addrinfo],
+        ):
+            with pytest.raises(OSError):
+                _resolve_host("example.com")
+            assert _resolve_host("example.com") == (ipaddress.ip_address("93.184.216.34"),)
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from pyflow.tools.storage import StorageTool
 
@@ -80,6 +80,105 @@ class TestStorageToolExecute:
         parsed = json.loads(read_result["content"])
         assert parsed == {"key": "value"}
 
+    async def test_write_keeps_big_ints_exact(self, tmp_path):
+        tool = StorageTool()
+        filepath = str(tmp_path / "ids.json")
+
+        result = await tool.execute(
+            tool_context=MagicMock(),
+            path=filepath,
+            action="write",
+            data='{"id": 123456789012345678901234567890}',
+        )
+
+        assert json.loads(result["content"]) == {"id": 123456789012345678901234567890}
+
+    async def test_write_replaces_file_atomically(self, tmp_path):
+        tool = StorageTool()
+        path = tmp_path / "state.json"
+        path.write_text("old", encoding="utf-8")
+
+        with patch("pyflow.tools.storage.os.replace", side_effect=OSError("disk full")):
+            result = await tool.execute(
+                tool_context=MagicMock(), path=str(path), action="write", data="new"
+            )
+
+        # A failed write leaves the original intact and no temp file behind.
+        assert result["status"] == "error"
+        assert path.read_text(encoding="utf-8") == "old"
+        assert list(tmp_path.iterdir()) == [path]
+
+        await tool.execute(tool_context=MagicMock(), path=str(path), action="write", data="new")
+        assert path.read_text(encoding="utf-8") == "new"
+        assert list(tmp_path.iterdir()) == [path]
+
+    async def test_jsonl_append_and_read_records(self, tmp_path):
+        tool = StorageTool()
+        filepath = str(tmp_path / "history.jsonl")
+
+        for rate in (4000.5, 4012.25):
+            result = await tool.execute(
+                tool_context=MagicMock(),
+                path=filepath,
+                action="append",
+                data=json.dumps({"rate": rate}),
+            )
+            assert result["status"] == "success"
+
+        read_result = await tool.execute(tool_context=MagicMock(), path=filepath, action="read")
+        assert read_result["content"] == '{"rate": 4000.5}\n{"rate": 4012.25}\n'
+        assert read_result["records"] == [{"rate": 4000.5}, {"rate": 4012.25}]
+        assert read_result["invalid_lines"] == []
+
+    async def test_jsonl_read_skips_invalid_lines(self, tmp_path):
+        tool = StorageTool()
+        path = tmp_path / "history.jsonl"
+        # Line 2 is two records from the old newline-less append, line 3 is plain text.
+        content = '{"a": 1}\n{"a": 2}{"a": 3}\nnot json\n{"a": 4}\n'
+        path.write_text(content, encoding="utf-8")
+
+        result = await tool.execute(tool_context=MagicMock(), path=str(path), action="read")
+
+        assert result["status"] == "success"
+        assert result["content"] == content
+        assert result["records"] == [{"a": 1}, {"a": 4}]
+        assert result["invalid_lines"] == [2, 3]
+
+    async def test_jsonl_append_writes_only_the_record(self, tmp_path):
+        tool = StorageTool()
+        path = tmp_path / "big.jsonl"
+        path.write_text('{"rate":1}\n' * 10_000, encoding="utf-8")
+        size_before = path.stat().st_size
+
+        result = await tool.execute(
+            tool_context=MagicMock(), path=str(path), action="append", data='{"rate": 2}'
+        )
+
+        assert result["content"] == '{"rate": 2}\n'
+        assert path.stat().st_size - size_before == len('{"rate": 2}\n')
+
+    async def test_jsonl_append_rejects_non_json(self, tmp_path):
+        tool = StorageTool()
+        filepath = str(tmp_path / "history.jsonl")
+
+        result = await tool.execute(
+            tool_context=MagicMock(), path=filepath, action="append", data="not json"
+        )
+
+        assert result["status"] == "error"
+        assert "JSON" in result["error"]
+
+    async def test_jsonl_append_accepts_null_record(self, tmp_path):
+        tool = StorageTool()
+        path = tmp_path / "history.jsonl"
+
+        result = await tool.execute(
+            tool_context=MagicMock(), path=str(path), action="append", data="null"
+        )
+
+        assert result["status"] == "success"
+        assert path.read_text(encoding="utf-8") == "null\n"
+
     async def test_unknown_action(self, tmp_path):
         tool = StorageTool()
         filepath = str(tmp_path / "test.txt")
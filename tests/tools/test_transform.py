@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import contextlib
 import json
-from unittest.mock import MagicMock
+from typing import Any
+from unittest.mock import MagicMock, patch
 
-from pyflow.tools.transform import TransformTool
+import jsonpath_ng
+import pytest
+
+from pyflow.tools.transform import TransformTool, _compile_jsonpath
 
 
 class TestTransformToolExecute:
@@ -78,7 +83,88 @@ class TestTransformToolExecute:
         assert result["result"] is None
         assert result["error"] == "Invalid JSON input"
 
+    async def test_jsonpath_expression_cached(self):
+        tool = TransformTool()
+        _compile_jsonpath.cache_clear()
+        with patch("pyflow.tools.transform.jp_parse", wraps=jsonpath_ng.parse) as jp:
+            for value in range(3):
+                result = await tool.execute(
+                    tool_context=MagicMock(),
+                    input_data=json.dumps({"items": [{"id": value}, {"id": 0}]}),
+                    expression="$.items[*].id",
+                )
+                assert result["result"] == [value, 0]
+        _compile_jsonpath.cache_clear()
+
+        assert jp.call_count == 1
+
     def test_auto_registered(self):
         from pyflow.tools.base import get_registered_tools
 
         assert "transform" in get_registered_tools()
+
+
+_PARITY_DOC: dict[str, Any] = {
+    "data": {"users": [{"name": "ana", "tags": ["x"]}, {"name": "bo"}], "count": 2},
+    "items": [1, 2, 3],
+    "text": "abc",
+    "none": None,
+    "zero": 0,
+    "off": False,
+    "when": 1,
+}
+
+
+class TestSimplePathFastPath:
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "$.data.users[0].name",
+            "$.data.users[1].name",
+            "$.data.users[0].tags[0]",
+            "$.data.users[5].name",
+            "$.data.users.name",
+            "$.data.count",
+            "$.data.missing",
+            "$.items[2]",
+            "$.items[01]",
+            "$.items.x",
+            "$.text[1]",
+            "$.text.x",
+            "$.data[0]",
+            "$.none",
+            "$.none[0]",
+            "$.zero[0]",
+            "$.off[0]",
+            "$.when",
+        ],
+    )
+    def test_matches_jsonpath_ng(self, expression: str):
+        expected = [m.value for m in jsonpath_ng.parse(expression).find(_PARITY_DOC)]
+        assert _compile_jsonpath(expression)(_PARITY_DOC) == expected
+
+    def test_index_into_scalar_raises_like_jsonpath_ng(self):
+        with pytest.raises(TypeError):
+            jsonpath_ng.parse("$.data.count[0]").find(_PARITY_DOC)
+        with pytest.raises(TypeError):
+            _compile_jsonpath("$.data.count[0]")(_PARITY_DOC)
+
+    def test_simple_path_skips_jsonpath_ng(self):
+        _compile_jsonpath.cache_clear()
+        with patch("pyflow.tools.transform.jp_parse") as jp:
+            assert _compile_jsonpath("$.data.users[0].name")(_PARITY_DOC) == ["ana"]
+        _compile_jsonpath.cache_clear()
+
+        jp.assert_not_called()
+
+    @pytest.mark.parametrize("expression", ["$.items[*]", "$..name", "$.where", "$.items[-1]"])
+    def test_other_expressions_use_jsonpath_ng(self, expression: str):
+        _compile_jsonpath.cache_clear()
+        with (
+            patch("pyflow.tools.transform.jp_parse", wraps=jsonpath_ng.parse) as jp,
+            contextlib.suppress(Exception),
+        ):
+            _compile_jsonpath(expression)
+        _compile_jsonpath.cache_clear()
+
+        jp.assert_called_once_with(expression)